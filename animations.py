@@ -2,12 +2,20 @@
 Animations Module - Provides animated effects for UI transitions
 """
 import os
+import re
 import sys
 import time
 import random
 import shutil
+import signal
+import functools
+import numpy as np
 from rich.console import Console
+from rich.panel import Panel
 from rich.style import Style
+from rich.text import Text
+
+import assets
 
 # Globals for animation settings
 ANIMATION_SPEED = {
@@ -33,65 +41,267 @@ NEON_COLORS = [
     "#FFFF00",  # Yellow
 ]
 
+# Character class intro data: (art name, short description, long description)
+CLASS_INFO = {
+    "netrunner": (
+        "netrunner",
+        "Specialist in hacking and digital infiltration.",
+        "Specialist in hacking and digital infiltration. Exceptional at bypassing security and manipulating data."
+    ),
+    "street samurai": (
+        "street_samurai",
+        "Augmented fighter with unmatched combat skills.",
+        "Augmented fighter with unmatched combat skills. Cybernetic enhancements provide superior strength and reflexes."
+    ),
+    "techie": (
+        "techie",
+        "Expert in technology repair and improvised gadgets.",
+        "Expert in technology repair and improvised gadgets. Can create useful tools from scavenged parts."
+    ),
+    "fixer": (
+        "fixer",
+        "Connected dealer, negotiator, and information broker.",
+        "Connected dealer, negotiator, and information broker. Knows who to talk to and how to make deals."
+    ),
+}
+# Unknown classes fall back to the generic hacker art with no description
+_DEFAULT_CLASS_INFO = ("hacker", "", "")
+
+@functools.lru_cache(maxsize=256)
+def _style(color, bold=None):
+    """Get a shared Style for a color, so repeated lookups don't rebuild it"""
+    return Style(color=color, bold=bold)
+
+# Pre-built styles for the animation loops, so frames don't re-parse colors
+_NEON_STYLES = tuple(_style(c) for c in NEON_COLORS)
+_MATRIX_GREEN = _style("#00FF00")
+_HOLOGRAM_BLUE = _style("#00AAFF", bold=False)
+_HOLOGRAM_CYAN_BOLD = _style("#00FFFF", bold=True)
+_HOLOGRAM_LIGHTBLUE = _style("#00CCFF", bold=False)
+_NEURAL_STYLES = (_style("#00FFFF"), _style("#00CCFF"), _style("#0088FF"))
+_HEART_RED = _style("#FF0000")
+_HEART_PINK = _style("#FF3366")
+_CIRCUIT_BLUE = _style("#00AAFF")
+# circuit_pattern pulse, brightest at the pulse and dimming with distance from it
+_CIRCUIT_PULSE_STYLES = tuple(
+    _style(f"#{255 - distance * 40:02X}{255 - distance * 40:02X}FF") for distance in range(5)
+)
+# data_stream greens, one per stream, varying in intensity from 155-255
+_STREAM_STYLES = tuple(_style(f"#00{155 + int((i / 5) * 100):02X}00") for i in range(5))
+
+# Raw truecolor SGR sequences for the neon palette, for writes that bypass Rich
+_NEON_SGR = tuple(f"\033[38;2;{int(c[1:3], 16)};{int(c[3:5], 16)};{int(c[5:7], 16)}m" for c in NEON_COLORS)
+_SGR_RESET = "\033[0m"
+
+# matrix_effect rain: 10% chance of a drop, split evenly between "0" and "1".
+# Pools are stored as code points so whole rows can be drawn with NumPy
+_MATRIX_POOL = " 01"
+_MATRIX_CODES = np.array([ord(c) for c in _MATRIX_POOL], dtype=np.uint32)
+_MATRIX_PROBS = np.array([0.9, 0.05, 0.05])
+_MATRIX_CUTOFFS = np.cumsum(_MATRIX_PROBS)
+
+# hacker_transition lines: 70% chance for a character, 30% for a blank.
+# Avoiding characters that might be interpreted as Rich markup
+_HACKER_CHARS = "01234567890!@#$%^&*()_+-=|\\;,.?/~`"
+_HACKER_POOL = " " + _HACKER_CHARS
+_HACKER_CODES = np.array([ord(c) for c in _HACKER_POOL], dtype=np.uint32)
+_HACKER_PROBS = np.array([0.3] + [0.7 / len(_HACKER_CHARS)] * len(_HACKER_CHARS))
+_HACKER_CUTOFFS = np.cumsum(_HACKER_PROBS)
+
+# Matches Rich markup tags like [green] or [/] so they can be stripped
+_MARKUP_RE = re.compile(r'\[[^\]]*\]')
+
+# Rich color tags for green at each intensity, used by the digital rain effects
+_GREEN_TAGS = tuple(f"[#00{intensity:02X}00]" for intensity in range(256))
+
+# Matches runs of non-space characters that can share a single color tag
+_GLYPH_RUN_RE = re.compile(r'[^ ]+')
+
+def _tag_runs(tag, line):
+    """Wrap each run of non-space characters in line with the given color tag"""
+    return _GLYPH_RUN_RE.sub(lambda run: tag + run.group() + "[/]", line)
+
+# Shared generator for the vectorized (NumPy) animation paths
+_rng = np.random.default_rng()
+
+def _random_chars(chars, n):
+    """Draw n random characters from chars. Two-character sets (like the "10"
+    data streams) take one bit each from a single getrandbits call, spelled out
+    as a binary string and translated; other sets use random.choices"""
+    if len(chars) == 2:
+        bits = format(random.getrandbits(n), f"0{n}b") if n > 0 else ""
+        return bits.translate({ord("0"): chars[0], ord("1"): chars[1]})
+    return "".join(random.choices(chars, k=n))
+
+# Scratch (rolls, code points) buffers for _random_line, keyed by width
+_line_buffers = {}
+
+def _random_line(codes, cutoffs, width):
+    """Draw a line of width characters from a code point pool in one vectorized pass.
+    cutoffs are the pool's cumulative probabilities; the per-width scratch
+    buffers are filled in place, so a frame allocates almost nothing"""
+    if width <= 0:
+        return ""
+    buffers = _line_buffers.get(width)
+    if buffers is None:
+        buffers = _line_buffers[width] = (np.empty(width), np.empty(width, dtype=np.uint32))
+    rolls, line = buffers
+    _rng.random(out=rolls)
+    # Clip guards the last cutoff summing to just under 1.0
+    np.take(codes, np.searchsorted(cutoffs, rolls, side="right"), out=line, mode="clip")
+    return str(line.view(f"U{width}")[0])
+
+# Cached terminal size and when it was read. SIGWINCH invalidates it right
+# away; the TTL covers platforms (or threads) where no handler can be installed
+_term_size_cache = [None, 0.0]
+
+def _get_term_size(ttl=1.0):
+    """Get the terminal size, querying the terminal only after a resize or once the TTL expires"""
+    size, checked_at = _term_size_cache
+    now = time.monotonic()
+    if size is None or now - checked_at >= ttl:
+        size = shutil.get_terminal_size()
+        _term_size_cache[0] = size
+        _term_size_cache[1] = now
+    return size
+
+if hasattr(signal, "SIGWINCH"):
+    try:
+        signal.signal(signal.SIGWINCH, lambda *_: _term_size_cache.__setitem__(0, None))
+    except ValueError:
+        # Not in the main thread; rely on the TTL instead
+        pass
+
 def set_animation_speed(speed):
     """Set the animation speed"""
     if speed in ANIMATION_SPEED:
         ANIMATION_SETTINGS["speed"] = speed
     
+def set_animations_enabled(enabled):
+    """Turn animations on or off"""
+    ANIMATION_SETTINGS["enabled"] = bool(enabled)
+
 def toggle_animations():
     """Toggle animations on/off"""
     ANIMATION_SETTINGS["enabled"] = not ANIMATION_SETTINGS["enabled"]
     return ANIMATION_SETTINGS["enabled"]
 
+def _write_frames(file, frames, delay):
+    """Write prebuilt raw frames in order, flushing and pausing after each one"""
+    write = file.write
+    flush = file.flush
+    sleep = time.sleep
+    for payload in frames:
+        write(payload)
+        flush()
+        if delay:
+            sleep(delay)
+
+def _frame_schedule(delay):
+    """Get a tick() that paces a frame loop on a fixed perf_counter schedule:
+    it sleeps only for whatever is left of the current frame, and not at all
+    when rendering has already run late"""
+    perf_counter = time.perf_counter
+    sleep = time.sleep
+    next_t = perf_counter()
+    
+    def tick():
+        nonlocal next_t
+        next_t += delay
+        remaining = next_t - perf_counter()
+        if remaining > 0:
+            sleep(remaining)
+    
+    return tick
+
 def get_animation_delay():
     """Get the current animation delay based on settings"""
+    # Read the settings on every call so direct writes to ANIMATION_SETTINGS apply
     if not ANIMATION_SETTINGS["enabled"]:
         return ANIMATION_SPEED["instant"]
     return ANIMATION_SPEED[ANIMATION_SETTINGS["speed"]]
 
+def _skip_animation(console):
+    """Whether to show only the final frame: animations are disabled, or the
+    console isn't a terminal that understands the cursor-movement escapes"""
+    return not ANIMATION_SETTINGS["enabled"] or not console.is_terminal
+
+def _cursor_up(n):
+    """Escape sequence moving the cursor to the start of the line n lines up.
+    A zero count would still move one line, so it gets no sequence at all"""
+    return f"\033[{n}F" if n > 0 else ""
+
+def _flush_frame(console, lines, style=None, end="\n"):
+    """Print a whole frame's lines (Rich markup allowed) in a single call,
+    skipping the regex highlighter"""
+    console.print("\n".join(lines), style=style, end=end, highlight=False)
+
+def _style_codes(console, style):
+    """Get the escape codes that open and close style on this console, rendered once by Rich"""
+    with console.capture() as capture:
+        console.out("X", style=style, end="", highlight=False)
+    prefix, _, suffix = capture.get().partition("X")
+    return prefix, suffix
+
+def _glyph_codes(text):
+    """Get the code points of text as an array, plus a mask of its blank characters"""
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    blank = np.array([not char.strip() for char in text], dtype=bool)
+    return codes, blank
+
+def _codes_text(codes):
+    """Turn an array of code points back into a string"""
+    return codes.astype("<u4").tobytes().decode("utf-32-le")
+
+def _scramble_codes(codes, blank, pool_codes, chance):
+    """Replace each non-blank code point with a random pick from pool_codes at the given chance"""
+    n = codes.size
+    picks = pool_codes[_rng.integers(0, pool_codes.size, n)]
+    hits = (_rng.random(n) < chance) & ~blank
+    return _codes_text(np.where(hits, picks, codes))
+
+def _scramble(text, pool, chance):
+    """Replace each non-blank character of text with a random pick from pool at the given chance"""
+    codes, blank = _glyph_codes(text)
+    return _scramble_codes(codes, blank, _glyph_codes(pool)[0], chance)
+
 def glitch_text(text, console, style=None, glitch_chars="!@#$%^&*<>?_-+=|~"):
     """Display text with a glitch effect"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         console.print(text, style=style)
         return
     
     delay = get_animation_delay()
-    length = len(text)
+    
+    # Convert the text and glitch pool to code point arrays once for all iterations
+    text_codes, blank = _glyph_codes(text)
+    glitch_codes = _glyph_codes(glitch_chars)[0]
     
     # First display with glitches
+    wait_frame = _frame_schedule(delay)
     for i in range(3):  # Do 3 glitch iterations
-        # Create a glitched version of text
-        glitched = ""
-        for char in text:
-            # 30% chance to replace with a glitch character
-            if char.strip() and random.random() < 0.3:
-                glitched += random.choice(glitch_chars)
-            else:
-                glitched += char
+        # Create a glitched version of text (30% chance to replace each character)
+        glitched = _scramble_codes(text_codes, blank, glitch_codes, 0.3)
         
         # Print the glitched text
         console.print(glitched, style=style, end="\r")
-        time.sleep(delay)
+        wait_frame()
     
     # Final clean version
     console.print(text, style=style)
 
 def cyber_scan(text, console, style=None):
     """Display text with a scanning effect from top to bottom"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         console.print(text, style=style)
         return
     
     delay = get_animation_delay()
     lines = text.split("\n")
     
-    # Clear the area first
-    for _ in range(len(lines)):
-        console.print(" ", end="\n")
-    
-    # Move cursor back up
-    for _ in range(len(lines)):
-        sys.stdout.write("\033[F")  # Move cursor up by one line
+    # Clear the area first, then move the cursor back up, in a single write
+    sys.stdout.write("\n" * len(lines) + _cursor_up(len(lines)))
+    sys.stdout.flush()
     
     # Print line by line with scanning effect
     for line in lines:
@@ -100,40 +310,47 @@ def cyber_scan(text, console, style=None):
 
 def neon_fade_in(text, console, style=None):
     """Display text with a neon fade-in effect"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         console.print(text, style=style)
         return
     
     delay = get_animation_delay()
     
     # Fade in using different neon colors
-    for color in NEON_COLORS:
-        console.print(text, style=Style(color=color), end="\r")
-        time.sleep(delay)
+    if (console.color_system == "truecolor" and isinstance(text, str)
+            and "[" not in text and "\n" not in text):
+        # Plain single-line text: write the color codes directly instead of
+        # going through Rich's render pipeline for every color
+        for sgr in _NEON_SGR:
+            console.file.write("\r" + sgr + text + _SGR_RESET)
+            console.file.flush()
+            time.sleep(delay)
+        console.file.write("\r")
+    else:
+        # Panels and markup need Rich to render them
+        for neon_style in _NEON_STYLES:
+            console.print(text, style=neon_style, end="\r")
+            time.sleep(delay)
     
     # Final version with the specified style
     console.print(text, style=style)
 
 def matrix_effect(text, console, style=None):
     """Display text with a Matrix-like falling effect"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         console.print(text, style=style)
         return
     
     delay = get_animation_delay()
-    width = shutil.get_terminal_size().columns
-    rain_chars = "01"
+    term_size = _get_term_size()
+    width = term_size.columns
     
     # Create a "rain" effect before revealing text
-    for i in range(min(8, shutil.get_terminal_size().lines // 4)):
-        rain = ""
-        for j in range(width):
-            if random.random() < 0.1:  # 10% chance of a rain drop
-                rain += random.choice(rain_chars)
-            else:
-                rain += " "
-        console.print(rain, style=Style(color="#00FF00"), end="\r")  # Matrix green
-        time.sleep(delay)
+    wait_frame = _frame_schedule(delay)
+    for i in range(min(8, term_size.lines // 4)):
+        rain = _random_line(_MATRIX_CODES, _MATRIX_CUTOFFS, width)
+        console.print(rain, style=_MATRIX_GREEN, end="\r")  # Matrix green
+        wait_frame()
     
     # Final text display
     console.print(text, style=style)
@@ -149,13 +366,8 @@ def typing_effect(text, console, style=None):
     """
     # Extra safety - ensure we can gracefully handle any input
     try:
-        # Import here to prevent circular imports
-        from rich.panel import Panel
-        from rich.console import Console
-        from rich.text import Text
-        
         # Skip animation if disabled in settings
-        if not ANIMATION_SETTINGS["enabled"]:
+        if _skip_animation(console):
             console.print(text, style=style)
             return
         
@@ -180,22 +392,19 @@ def typing_effect(text, console, style=None):
             
             # Remove any rich formatting markers like [green] or [/]
             # This is a simple way to handle it, not perfect but works for common cases
-            import re
-            plain_text = re.sub(r'\[[^\]]*\]', '', plain_text)
+            plain_text = _MARKUP_RE.sub('', plain_text)
             
             # If we couldn't get meaningful text, just show the panel without animation
             if not plain_text:
                 console.print(panel)
                 return
             
-            # Type out the extracted text character by character
-            temp_console = Console(width=console.width, no_color=True)
+            # Type out the extracted text character by character, writing only
+            # the newly typed character on each tick
             try:
-                for i in range(min(len(plain_text) + 1, 500)):  # Limit to 500 chars for safety
-                    with temp_console.capture() as capture:
-                        temp_console.print(plain_text[:i], end="")
-                    captured_text = capture.get()
-                    console.print(captured_text, end="\r")
+                for char in plain_text[:499]:  # Limit to 500 chars for safety
+                    console.file.write(char)
+                    console.file.flush()
                     time.sleep(delay)
             except Exception:
                 # If any issue during animation, just show the panel
@@ -212,21 +421,25 @@ def typing_effect(text, console, style=None):
                     text = str(text)
                 
                 # Remove any Rich markup to prevent showing tags
-                import re
-                plain_text = re.sub(r'\[[^\]]*\]', '', text)
+                plain_text = _MARKUP_RE.sub('', text)
                 
-                # Type out the text character by character
-                for i in range(min(len(plain_text) + 1, 500)):  # Limit to 500 chars for safety
-                    # Create a Text object to ensure no markup interpretation
-                    current_text = Text(plain_text[:i])
-                    console.print(current_text, style=style, end="\r")
-                    time.sleep(delay)
+                # Type out the text character by character, writing only the
+                # newly typed character on each tick wrapped in the pre-rendered
+                # style codes, so Rich isn't involved per keystroke
+                style_on, style_off = _style_codes(console, style)
+                keystrokes = [style_on + char + style_off
+                              for char in plain_text[:499]]  # Limit to 500 chars for safety
+                
+                # Render the final version with proper styling up front so it
+                # can be written straight after the keystrokes
+                with console.capture() as capture:
+                    console.print()
+                    # Use a clean Text object for final display to avoid markup issues
+                    final_text = Text(plain_text)
+                    console.print(final_text, style=style)
                 
-                # Print the final version with proper styling
-                console.print()
-                # Use a clean Text object for final display to avoid markup issues
-                final_text = Text(plain_text)
-                console.print(final_text, style=style)
+                _write_frames(console.file, keystrokes, delay)
+                _write_frames(console.file, [capture.get()], 0)
             except Exception:
                 # Fallback to direct printing if animation fails
                 console.print(text, style=style)
@@ -244,59 +457,63 @@ def typing_effect(text, console, style=None):
 
 def loading_bar(console, length=20, message="Loading", style=None):
     """Display a cyberpunk-themed loading bar"""
-    if not ANIMATION_SETTINGS["enabled"]:
-        console.print(f"{message}... [Complete]", style=style)
+    if _skip_animation(console):
+        console.print(f"{message}... [Complete]", style=style, markup=False, highlight=False)
         return
     
     delay = get_animation_delay() * 2
     bar_chars = ["░", "▒", "▓", "█"]
     
-    for i in range(length + 1):
+    # Draw the empty bar once; each tick only fills the next cell and
+    # rewrites the percentage, addressing them by (1-based) column. The style
+    # codes are rendered once so every update is a single raw write
+    style_on, style_off = _style_codes(console, style)
+    prefix = f"{message}... ["
+    tail_column = len(prefix) + length + 1
+    
+    frames = [f"{style_on}{prefix}{'░' * length}] 0%{style_off}"]
+    for i in range(1, length + 1):
         percentage = int(i / length * 100)
-        progress = "█" * i + "░" * (length - i)
-        console.print(f"{message}... [{progress}] {percentage}%", style=style, end="\r")
-        time.sleep(delay)
+        frames.append(f"\033[{len(prefix) + i}G{style_on}█"
+                      f"\033[{tail_column}G] {percentage}%{style_off}")
+    
+    # Complete message, replacing the bar line
+    complete = f"\r\033[K{style_on}{message}... [Complete]{style_off}\n"
     
-    # Complete message
-    console.print(f"{message}... [Complete]", style=style)
+    _write_frames(console.file, frames, delay)
+    _write_frames(console.file, [complete], 0)
 
 def hacker_transition(console, lines=5):
     """Create a hacker-style transition effect between UI screens"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         return
     
     delay = get_animation_delay()
-    width = shutil.get_terminal_size().columns
+    width = _get_term_size().columns
     
     # Clear screen first
     console.clear()
     
-    # Generate random hacker-style lines
-    # Avoiding characters that might be interpreted as Rich markup
-    hacker_chars = "01234567890!@#$%^&*()_+-=|\\;,.?/~`"
+    # Bind hot-loop callables to locals
+    choice = random.choice
     
+    # Generate random hacker-style lines
+    wait_frame = _frame_schedule(delay)
     for _ in range(lines):
-        line = ""
-        line_color = random.choice(NEON_COLORS)
-        
-        for _ in range(width - 1):
-            if random.random() < 0.7:  # 70% chance for a character
-                line += random.choice(hacker_chars)
-            else:
-                line += " "
+        line_style = choice(_NEON_STYLES)
+        line = _random_line(_HACKER_CODES, _HACKER_CUTOFFS, width - 1)
         
         # Use a Text object instead of a string to avoid markup interpretation
-        from rich.text import Text
         text_obj = Text(line)
-        console.print(text_obj, style=Style(color=line_color))
-        time.sleep(delay)
+        console.print(text_obj, style=line_style)
+        wait_frame()
     
     time.sleep(delay * 3)  # Slight pause after transition
     console.clear()  # Clear again for the next screen
 
 def neon_border(text, console, style=None, border_char="█"):
     """Display text with a neon-colored border"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         # Just print text with style if animations disabled
         console.print(text, style=style)
         return
@@ -308,46 +525,36 @@ def neon_border(text, console, style=None, border_char="█"):
     # Add some padding to ensure border doesn't touch text
     padded_lines = ["  " + line + " " * (max_length - len(line) + 2) for line in lines]
     
-    # Top border
+    # Top border and bordered lines are identical in every frame, so build them once
     top_border = border_char * (max_length + 6)
+    framed_lines = [f"{border_char} {line} {border_char}" for line in padded_lines]
+    frame = "\n".join([top_border, *framed_lines, top_border])
+    
+    # Moves the cursor back over the whole bordered frame
+    cursor_up = _cursor_up(len(padded_lines) + 2)
     
     # Create frames with different neon colors
-    for color in NEON_COLORS:
-        border_style = Style(color=color)
-        
-        # Print top border
-        console.print(top_border, style=border_style)
-        
-        # Print each line with border
-        for line in padded_lines:
-            console.print(f"{border_char} {line} {border_char}", style=border_style)
-        
-        # Print bottom border
-        console.print(top_border, style=border_style)
+    for border_style in _NEON_STYLES:
+        # Print the whole bordered frame in one call
+        console.print(frame, style=border_style)
         
         time.sleep(delay)
         
         # Move cursor back to start of output
-        for _ in range(len(padded_lines) + 2):
-            sys.stdout.write("\033[F")
+        sys.stdout.write(cursor_up)
     
     # Final version with proper styles
-    console.print(top_border, style=style)
-    for line in padded_lines:
-        console.print(f"{border_char} {line} {border_char}", style=style)
-    console.print(top_border, style=style)
+    console.print(frame, style=style)
 
 def cyber_flicker(text, console, style=None, flicker_count=3):
     """Display text with a flickering neon effect"""
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         console.print(text, style=style)
         return
     
     delay = get_animation_delay()
     
     # Check if we're dealing with a Panel or rich component that doesn't support len()
-    from rich.panel import Panel
-    from rich.text import Text
     
     # For Panel objects, use a different approach
     if isinstance(text, Panel) or not hasattr(text, "__len__"):
@@ -367,14 +574,22 @@ def cyber_flicker(text, console, style=None, flicker_count=3):
         console.print(text, style=style)
         return
     
-    # Regular string handling
+    # Regular string handling: render the styled text once, then just
+    # alternate raw writes of the blank and styled frames
+    with console.capture() as capture:
+        console.print(text, style=style, end="\r")
+    text_frame = capture.get()
+    blank_frame = " " * len(text) + "\r"
+    
     for _ in range(flicker_count):
         # Display blank
-        console.print(" " * len(text), end="\r")
+        console.file.write(blank_frame)
+        console.file.flush()
         time.sleep(delay)
         
         # Display text
-        console.print(text, style=style, end="\r")
+        console.file.write(text_frame)
+        console.file.flush()
         time.sleep(delay * 2)
     
     # Final display
@@ -390,7 +605,7 @@ def digital_rain(console, duration=2.0, density=0.2, chars="01"):
         density: Density of characters (0.0 to 1.0)
         chars: Characters to use in the rain effect
     """
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         return
     
     # If we're running in the main game (not a test), use a simplified version
@@ -398,21 +613,22 @@ def digital_rain(console, duration=2.0, density=0.2, chars="01"):
     if os.environ.get("GAME_MODE") == "MAIN":
         # Just print a decorative line of matrix text instead
         lines = []
-        width = shutil.get_terminal_size().columns
-        height = min(5, shutil.get_terminal_size().lines - 2)
+        term_size = _get_term_size()
+        width = term_size.columns
+        height = min(5, term_size.lines - 2)
+        intensity_tags = _GREEN_TAGS[100:]
+        chance = min(density * 2, 1.0)  # Double density for visible effect
+        choices = random.choices
         
         for _ in range(height):
-            line = ""
-            for _ in range(width):
-                if random.random() < density * 2:  # Double density for visible effect
-                    intensity = random.randint(100, 255)
-                    line += f"[#00{intensity:02X}00]{random.choice(chars)}[/]"
-                else:
-                    line += " "
-            lines.append(line)
+            # Draw the whole row's rolls, colors and glyphs in bulk
+            hits = choices((True, False), weights=(chance, 1.0 - chance), k=width)
+            tags = choices(intensity_tags, k=width)
+            picks = choices(chars, k=width)
+            lines.append("".join(tag + pick + "[/]" if hit else " "
+                                 for hit, tag, pick in zip(hits, tags, picks)))
         
-        for line in lines:
-            console.print(line)
+        _flush_frame(console, lines)
         
         time.sleep(duration / 2)  # Shorter wait time
         return
@@ -422,55 +638,75 @@ def digital_rain(console, duration=2.0, density=0.2, chars="01"):
     
     # Ensure we have valid terminal dimensions to prevent index errors
     try:
-        width = max(1, shutil.get_terminal_size().columns)
-        height = max(1, min(15, shutil.get_terminal_size().lines - 5))
+        term_size = _get_term_size()
+        width = max(1, term_size.columns)
+        height = max(1, min(15, term_size.lines - 5))
     except Exception:
         # Fallback to safe values if terminal size detection fails
         width = 80
         height = 10
     
-    # Create an empty matrix with proper bounds checking
-    matrix = [[" " for _ in range(width)] for _ in range(height)]
+    # The matrix holds indices into glyphs: 0 is an empty cell, 1..n a rain character.
+    # glyphs stores code points so a frame maps to a contiguous buffer that can be
+    # viewed as one fixed-width string per row without touching individual cells
+    n_chars = len(chars)
+    glyphs = np.array([ord(" ")] + [ord(c) for c in chars], dtype=np.uint32)
+    row_dtype = np.dtype(f"U{width}")
+    matrix = np.zeros((height, width), dtype=np.min_scalar_type(n_chars))
+    
+    # Buffers reused by every frame: the random rolls, and the frame's code
+    # points, whose fixed-width row strings are a view that never needs rebuilding
+    top_roll = np.empty(width)
+    roll = np.empty((height - 1, width))
+    frame = np.empty((height, width), dtype=np.uint32)
+    rows = frame.view(row_dtype).ravel()
+    
+    # Color tag per row, fading as drops go down
+    row_tags = [_GREEN_TAGS[max(0, 255 - (y * 18))] for y in range(height)]
+    
+    # Bind hot-loop callables to locals
+    rng_random = _rng.random
+    rng_integers = _rng.integers
+    write = sys.stdout.write
     
     # Setup for animation
-    start_time = time.time()
+    start_time = time.monotonic()
     
     try:
-        while time.time() - start_time < duration:
+        # Clear once; each frame then homes the cursor and overwrites in place
+        console.clear()
+        wait_frame = _frame_schedule(delay)
+        
+        while time.monotonic() - start_time < duration:
             # Add new raindrops at the top row
-            for x in range(width):
-                if random.random() < density:
-                    matrix[0][x] = random.choice(chars)
+            spawn = rng_random(out=top_roll) < density
+            matrix[0][spawn] = rng_integers(1, n_chars + 1, spawn.sum())
             
-            # Move all existing drops down
-            for y in range(height-1, 0, -1):
-                for x in range(width):
-                    if matrix[y-1][x] != " " and random.random() < 0.9:
-                        matrix[y][x] = random.choice(chars)
-                    elif random.random() < 0.05:  # Random fading
-                        matrix[y][x] = " "
+            # Move all existing drops down (decided from the previous frame's rows).
+            # One roll per cell drives both masks: below a drop it moves under 0.9,
+            # and the 5% fade chance for cells that don't move is carved out of
+            # the remaining range, so no second whole-matrix draw is needed
+            occupied = matrix[:-1] != 0
+            rng_random(out=roll)
+            move = occupied & (roll < 0.9)
+            fade = np.where(occupied, (roll >= 0.9) & (roll < 0.905), roll < 0.05)  # Random fading
+            below = matrix[1:]
+            below[move] = rng_integers(1, n_chars + 1, move.sum())
+            below[fade] = 0
             
             # Clear the top row
-            for x in range(width):
-                # 80% chance to clear a cell in top row after moving it down
-                if random.random() < 0.8:
-                    matrix[0][x] = " "
+            # 80% chance to clear a cell in top row after moving it down
+            matrix[0][rng_random(out=top_roll) < 0.8] = 0
             
-            # Render the current state
-            console.clear()
-            for y in range(height):
-                line = ""
-                for x in range(width):
-                    char = matrix[y][x]
-                    # Add color variance based on depth
-                    if char != " ":
-                        intensity = max(0, 255 - (y * 18))  # Fade as it goes down
-                        line += f"[#00{intensity:02X}00]{char}[/]"
-                    else:
-                        line += " "
-                console.print(line)
+            # Render the current state over the previous frame. Every row is
+            # exactly width cells wide, so stale glyphs are always overwritten
+            write("\033[H")
+            # Add color variance based on depth, and print the frame in one call
+            np.take(glyphs, matrix, out=frame)
+            _flush_frame(console, [_tag_runs(row_tags[y], str(row))
+                                   for y, row in enumerate(rows)])
             
-            time.sleep(delay)
+            wait_frame()
     except (KeyboardInterrupt, EOFError):
         # Handle interruptions gracefully
         pass
@@ -489,18 +725,15 @@ def hologram_effect(text, console, style=None):
         console: Console for output
         style: Style to apply to the text
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
-        # Create a Text object to prevent rich markup interpretation even when animation is disabled
-        text_obj = Text(text)
-        console.print(text_obj, style=style)
+    if _skip_animation(console):
+        # Print the plain string with markup, emoji and highlighting off
+        console.print(text, style=style, markup=False, emoji=False, highlight=False)
         return
     
     delay = get_animation_delay()
     lines = text.split("\n")
     max_length = max(len(line) for line in lines)
+    cursor_up = _cursor_up(len(lines))
     
     # Use rich.text.Text objects to prevent special character interpretation
     
@@ -509,53 +742,40 @@ def hologram_effect(text, console, style=None):
         # Static noise effect
         noise_lines = []
         for line in lines:
-            noise = ""
-            for char in line:
-                if char.strip():
-                    if random.random() < 0.5:
-                        noise += random.choice("▓▒░")
-                    else:
-                        noise += char
-                else:
-                    noise += " "
+            noise = _scramble(line, "▓▒░", 0.5)
             noise_lines.append(noise + " " * (max_length - len(line)))
         
-        # Display noise with a blue hologram tint
-        for noise_line in noise_lines:
-            # Create a Text object to prevent rich markup interpretation
-            text_obj = Text(noise_line)
-            console.print(text_obj, style=Style(color="#00AAFF", bold=False), end="\n")
+        # Display noise with a blue hologram tint, the whole frame at once
+        # Create a Text object to prevent rich markup interpretation
+        text_obj = Text("\n".join(noise_lines))
+        console.print(text_obj, style=_HOLOGRAM_BLUE, end="\n")
         
         time.sleep(delay)
         
         # Move cursor back up
-        for _ in range(len(lines)):
-            sys.stdout.write("\033[F")
+        sys.stdout.write(cursor_up)
     
     # Display with scan lines effect
     for i in range(2):
+        # Assemble the frame as one Text object to prevent rich markup interpretation
+        frame = Text()
         for j, line in enumerate(lines):
-            # Create a Text object for each line to prevent rich markup interpretation
-            text_obj = Text(line)
-            
             # Add scan line effect
             if i % 2 == j % 2:
                 # Add a slight brightness variation to alternate lines
-                console.print(text_obj, style=Style(color="#00FFFF", bold=True), end="\n")
+                frame.append(line + "\n", style=_HOLOGRAM_CYAN_BOLD)
             else:
-                console.print(text_obj, style=Style(color="#00CCFF", bold=False), end="\n")
+                frame.append(line + "\n", style=_HOLOGRAM_LIGHTBLUE)
+        console.print(frame, end="")
         
         time.sleep(delay)
         
         # Move cursor back up
-        for _ in range(len(lines)):
-            sys.stdout.write("\033[F")
+        sys.stdout.write(cursor_up)
     
-    # Final display with proper style
-    for line in lines:
-        # Create a Text object for final display
-        text_obj = Text(line)
-        console.print(text_obj, style=style, end="\n")
+    # Final display with proper style, all lines in one Text object
+    text_obj = Text("\n".join(lines))
+    console.print(text_obj, style=style, end="\n")
 
 def data_corruption(text, console, style=None, corruption_level=0.3):
     """
@@ -567,13 +787,9 @@ def data_corruption(text, console, style=None, corruption_level=0.3):
         style: Style to apply to the text
         corruption_level: Level of corruption (0.0 to 1.0)
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
-        # Create a Text object to prevent rich markup interpretation even when animation is disabled
-        text_obj = Text(text)
-        console.print(text_obj, style=style)
+    if _skip_animation(console):
+        # Print the plain string with markup, emoji and highlighting off
+        console.print(text, style=style, markup=False, emoji=False, highlight=False)
         return
     
     delay = get_animation_delay()
@@ -584,14 +800,13 @@ def data_corruption(text, console, style=None, corruption_level=0.3):
     console.print(text_obj, style=style, end="\r")
     time.sleep(delay * 3)
     
+    # Convert the text and corruption pool to code point arrays once for all passes
+    text_codes, blank = _glyph_codes(text)
+    corruption_codes = _glyph_codes(corruption_chars)[0]
+    
     # Apply increasing corruption
     for level in [0.1, 0.3, 0.6, corruption_level]:
-        corrupted = ""
-        for char in text:
-            if char.strip() and random.random() < level:
-                corrupted += random.choice(corruption_chars)
-            else:
-                corrupted += char
+        corrupted = _scramble_codes(text_codes, blank, corruption_codes, level)
         
         text_obj = Text(corrupted)
         console.print(text_obj, style=style, end="\r")
@@ -599,12 +814,7 @@ def data_corruption(text, console, style=None, corruption_level=0.3):
     
     # Show mild corruption briefly
     for _ in range(2):
-        mild_corrupted = ""
-        for char in text:
-            if char.strip() and random.random() < 0.1:
-                mild_corrupted += random.choice(corruption_chars)
-            else:
-                mild_corrupted += char
+        mild_corrupted = _scramble_codes(text_codes, blank, corruption_codes, 0.1)
         
         text_obj = Text(mild_corrupted)
         console.print(text_obj, style=style, end="\r")
@@ -623,37 +833,30 @@ def code_decryption(text, console, style=None):
         console: Console for output
         style: Style to apply to the text
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
-        # Create a Text object to prevent rich markup interpretation even when animation is disabled
-        text_obj = Text(text)
-        console.print(text_obj, style=style)
+    if _skip_animation(console):
+        # Print the plain string with markup, emoji and highlighting off
+        console.print(text, style=style, markup=False, emoji=False, highlight=False)
         return
     
     delay = get_animation_delay() * 1.5
     encrypted_chars = "!@#$%^&*()_+{}|:<>?~`-=[]\\;',./0123456789ABCDEF"
     
-    # Create a mask of which characters are fixed (remain static)
-    fixed_chars = [False] * len(text)
+    # Work on code point arrays: spaces and newlines always show through, and
+    # fixed marks the characters that have been decrypted so far
+    text_codes = _glyph_codes(text)[0]
+    encrypted_codes = _glyph_codes(encrypted_chars)[0]
+    length = text_codes.size
+    static = (text_codes == ord(" ")) | (text_codes == ord("\n"))
+    fixed = np.zeros(length, dtype=bool)
     
     # Start with all characters randomized
     for i in range(10):  # Do multiple iterations of decryption
-        current = ""
+        # 10% chance to decrypt each character on each pass
+        fixed |= _rng.random(length) < 0.1
         
-        for j, char in enumerate(text):
-            if fixed_chars[j] or char == " " or char == "\n":
-                # This character is already decrypted or is a space/newline
-                current += char
-            else:
-                # 10% chance to decrypt this character on each pass
-                if random.random() < 0.1:
-                    fixed_chars[j] = True
-                    current += char
-                else:
-                    # Still encrypted, show a random character
-                    current += random.choice(encrypted_chars)
+        # Still-encrypted characters show a random pick from the pool
+        picks = encrypted_codes[_rng.integers(0, encrypted_codes.size, length)]
+        current = _codes_text(np.where(fixed | static, text_codes, picks))
         
         # Print the current state
         text_obj = Text(current)
@@ -674,17 +877,13 @@ def neural_interface(console, message="NEURAL LINK ESTABLISHED", style=None, dur
         style: Style to apply to the text
         duration: Duration of the animation in seconds
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
-        # Create a Text object to prevent rich markup interpretation even when animation is disabled
-        text_obj = Text(message)
-        console.print(text_obj, style=style)
+    if _skip_animation(console):
+        # Print the plain string with markup, emoji and highlighting off
+        console.print(message, style=style, markup=False, emoji=False, highlight=False)
         return
     
     delay = get_animation_delay() * 0.5
-    width = min(shutil.get_terminal_size().columns - 2, 50)
+    width = min(_get_term_size().columns - 2, 50)
     
     # Brain wave patterns (simplified EEG-like patterns)
     patterns = [
@@ -696,27 +895,32 @@ def neural_interface(console, message="NEURAL LINK ESTABLISHED", style=None, dur
         "  /     \\_/    \\__/",
     ]
     
+    # Pre-render every rotation of each pattern, tiled to fit the width
+    rotations = [
+        [((pattern[k:] + pattern[:k]) * (width // len(pattern) + 2))[:width] for k in range(len(pattern))]
+        for pattern in patterns
+    ]
+    
+    # Color varies by pattern; pair each pattern's rotations with its length and style
+    waves = [
+        (pattern_rotations, len(pattern_rotations), _NEURAL_STYLES[pattern_idx % len(_NEURAL_STYLES)])
+        for pattern_idx, pattern_rotations in enumerate(rotations)
+    ]
+    
     # Start time
-    start_time = time.time()
+    start_time = time.monotonic()
     
     # Display moving brain wave patterns
-    while time.time() - start_time < duration:
-        for pattern_idx, pattern in enumerate(patterns):
-            # Create a slice of the pattern that "moves" from right to left
-            offset = int((time.time() - start_time) * 10) % len(pattern)
-            display_pattern = pattern[offset:] + pattern[:offset]
-            
-            # Adjust the pattern to fit the width
-            display_pattern = display_pattern * (width // len(display_pattern) + 2)
-            display_pattern = display_pattern[:width]
-            
-            # Color varies by pattern
-            colors = ["#00FFFF", "#00CCFF", "#0088FF"]
-            color_idx = pattern_idx % len(colors)
+    wait_frame = _frame_schedule(delay)
+    while time.monotonic() - start_time < duration:
+        for pattern_rotations, pattern_length, pattern_style in waves:
+            # Pick the rotation that makes the pattern "move" from right to left
+            offset = int((time.monotonic() - start_time) * 10) % pattern_length
+            display_pattern = pattern_rotations[offset]
             
             # Print the pattern line
-            console.print(display_pattern, style=Style(color=colors[color_idx]), end="\r")
-            time.sleep(delay)
+            console.print(display_pattern, style=pattern_style, end="\r")
+            wait_frame()
     
     # Final message
     if message:
@@ -733,18 +937,15 @@ def heartbeat_monitor(console, heartbeats=5, bpm=80, flatline=False, style=None)
         flatline: Whether to end with a flatline effect
         style: Style to apply to the text
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         if flatline:
-            # Create a Text object to prevent rich markup interpretation even when animation is disabled
-            text_obj = Text("_____________________")
-            console.print(text_obj, style=Style(color="#FF0000"))
+            # Print the plain string with markup, emoji and highlighting off
+            console.print("_____________________", style=_HEART_RED,
+                          markup=False, emoji=False, highlight=False)
         return
     
     delay = 60 / (bpm * 20)  # Convert BPM to delay between frames (20 frames per beat)
-    width = min(shutil.get_terminal_size().columns - 5, 50)
+    width = min(_get_term_size().columns - 5, 50)
     
     # Heartbeat pattern frames (simplification of ECG)
     heartbeat = [
@@ -770,27 +971,29 @@ def heartbeat_monitor(console, heartbeats=5, bpm=80, flatline=False, style=None)
         "   |            _",
     ]
     
-    # Animate the monitor
+    # Pad each pattern frame to fill the width
+    frames = [frame.ljust(width, "_") for frame in heartbeat]
+    
+    # Animate the monitor on a fixed schedule so the BPM holds
+    wait_frame = _frame_schedule(delay)
     for _ in range(heartbeats):
-        for frame in heartbeat:
-            # Pad the pattern to fill the width
-            display = frame.ljust(width, "_")
-            
+        for display in frames:
             # Print with heart rate color
-            console.print(display, style=Style(color="#FF3366"), end="\r")
-            time.sleep(delay)
+            console.print(display, style=_HEART_PINK, end="\r")
+            wait_frame()
     
     # Flatline animation if requested
     if flatline:
+        wait_frame = _frame_schedule(delay * 5)
         for i in range(10):
             if i % 2 == 0:
-                console.print("_" * width, style=Style(color="#FF0000"), end="\r")
+                console.print("_" * width, style=_HEART_RED, end="\r")
             else:
                 console.print(" " * width, end="\r")
-            time.sleep(delay * 5)
+            wait_frame()
         
         # Final flatline
-        console.print("_" * width, style=Style(color="#FF0000"))
+        console.print("_" * width, style=_HEART_RED)
     else:
         # End with a blank line
         console.print(" " * width)
@@ -804,18 +1007,14 @@ def circuit_pattern(console, duration=2.0, style=None):
         duration: Duration of the animation in seconds
         style: Style to apply to the circuit
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         # When animations are disabled, just display a simple circuit symbol
         circuit_symbol = "◉─◌─┼─□"
-        text_obj = Text(circuit_symbol)
-        console.print(text_obj, style=Style(color="#00AAFF"))
+        console.print(circuit_symbol, style=_CIRCUIT_BLUE, markup=False, emoji=False, highlight=False)
         return
     
     delay = get_animation_delay() * 0.8
-    width = min(shutil.get_terminal_size().columns - 2, 60)
+    width = min(_get_term_size().columns - 2, 60)
     height = 5
     
     # Circuit elements
@@ -877,74 +1076,60 @@ def circuit_pattern(console, duration=2.0, style=None):
         corner_type = random.choice([corner_tl, corner_tr, corner_bl, corner_br])
         circuit[y][x] = corner_type
     
+    # Everything that can be placed while the circuit mutates
+    circuit_pool = components + [h_line, v_line, t_down, t_up, t_right, t_left, cross]
+    
+    # Bind hot-loop callables to locals
+    rand = random.random
+    choice = random.choice
+    randint = random.randint
+    
+    # Each row's text is cached and only rebuilt when one of its cells mutates
+    lines = ["".join(row) for row in circuit]
+    
     # Animation timing
-    start_time = time.time()
+    start_time = time.monotonic()
     
     # Main animation loop
-    while time.time() - start_time < duration:
+    wait_frame = _frame_schedule(delay)
+    while time.monotonic() - start_time < duration:
         # Randomly modify the circuit pattern
         for _ in range(3):
-            x = random.randint(0, width-1)
-            y = random.randint(0, height-1)
+            x = randint(0, width-1)
+            y = randint(0, height-1)
             
             # Higher chance to place a component near existing circuits
-            if circuit[y][x] != " " or random.random() < 0.3:
-                circuit[y][x] = random.choice(components + [h_line, v_line, t_down, t_up, t_right, t_left, cross])
+            if circuit[y][x] != " " or rand() < 0.3:
+                circuit[y][x] = choice(circuit_pool)
+                lines[y] = "".join(circuit[y])
         
         # Render the current state with a moving "pulse" of energy
-        pulse_pos = int(((time.time() - start_time) * 15) % width)
-        from rich.text import Text
+        pulse_pos = int(((time.monotonic() - start_time) * 15) % width)
+        pulse_start = max(pulse_pos - 4, 0)
+        pulse_end = min(pulse_pos + 5, width)
+        pulse_styles = [_CIRCUIT_PULSE_STYLES[abs(x - pulse_pos)]
+                        for x in range(pulse_start, pulse_end)]
         
-        for y in range(height):
-            # Build the line as a list of characters first
-            line_chars = []
-            line_styles = []
-            
-            for x in range(width):
-                char = circuit[y][x]
-                
-                # Add a color pulse that moves across the circuit
-                if circuit[y][x] != " ":
-                    distance = abs(x - pulse_pos)
-                    if distance < 5:
-                        intensity = 255 - (distance * 40)
-                        color = f"#{intensity:02X}{intensity:02X}FF"
-                    else:
-                        color = "#00AAFF"
-                    
-                    line_chars.append(char)
-                    line_styles.append((len(line_chars) - 1, 1, Style(color=color)))
-                else:
-                    line_chars.append(" ")
-            
-            # Create a Text object with styled spans
-            line_text = Text("".join(line_chars))
-            for start, length, style in line_styles:
-                line_text.stylize(style, start, start + length)
-                
-            console.print(line_text)
+        # Every row is plain blue except the few cells under the pulse, so a
+        # row is just its blue head and tail around the pulse-colored cells.
+        # (Coloring blank cells is invisible, so they need no special case)
+        segments = []
+        for line in lines:
+            segments.append((line[:pulse_start], _CIRCUIT_BLUE))
+            segments.extend(zip(line[pulse_start:pulse_end], pulse_styles))
+            segments.append((line[pulse_end:] + "\n", _CIRCUIT_BLUE))
+        segments[-1] = (lines[-1][pulse_end:], _CIRCUIT_BLUE)
         
-        time.sleep(delay)
+        # Assemble and print the whole frame in one call
+        console.print(Text.assemble(*segments))
+        
+        wait_frame()
         
         # Move cursor back to start
-        for _ in range(height):
-            sys.stdout.write("\033[F")
+        sys.stdout.write(_cursor_up(height))
     
-    # Final clean display
-    from rich.text import Text
-    
-    for y in range(height):
-        # Create a line manually without rich markup
-        line_chars = []
-        for x in range(width):
-            if circuit[y][x] != " ":
-                line_chars.append(circuit[y][x])
-            else:
-                line_chars.append(" ")
-                
-        # Create a Text object to prevent markup interpretation
-        line_text = Text("".join(line_chars))
-        console.print(line_text, style=Style(color="#00AAFF"))
+    # Final clean display, all rows in one print
+    console.print("\n".join(lines), style=_CIRCUIT_BLUE, markup=False, emoji=False, highlight=False)
 
 def character_introduction(console, char_class, name=None):
     """
@@ -955,26 +1140,14 @@ def character_introduction(console, char_class, name=None):
         char_class: Character class (NetRunner, Street Samurai, Techie, Fixer)
         name: Character name (optional)
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    from rich.panel import Panel
-    from rich.style import Style
-    import assets
+    # Look up the class art and descriptions once
+    art_name, short_desc, description = CLASS_INFO.get(char_class.lower(), _DEFAULT_CLASS_INFO)
     
-    if not ANIMATION_SETTINGS["enabled"]:
+    if _skip_animation(console):
         # When animation is disabled, just display character info
         title = f"Character: {name if name else char_class}"
-        content = f"Class: {char_class}\n\n"
+        content = f"Class: {char_class}\n\n{short_desc}"
         
-        if char_class.lower() == "netrunner":
-            content += "Specialist in hacking and digital infiltration."
-        elif char_class.lower() == "street samurai":
-            content += "Augmented fighter with unmatched combat skills."
-        elif char_class.lower() == "techie":
-            content += "Expert in technology repair and improvised gadgets."
-        elif char_class.lower() == "fixer":
-            content += "Connected dealer, negotiator, and information broker."
-            
         # Create a Text object to prevent markup interpretation
         text_obj = Text(content)
         panel = Panel(text_obj, title=title)
@@ -989,44 +1162,33 @@ def character_introduction(console, char_class, name=None):
         
         # Create a Text object to prevent markup interpretation
         title_text = Text(title_art)
-        console.print(title_text, style=Style(color="#FF00FF"))  # Neon pink for logo
+        console.print(title_text, style=_style("#FF00FF"))  # Neon pink for logo
         time.sleep(1.0)
         
         # Clear the screen for the character intro
         console.clear()
     
-    # Get character ASCII art
-    art_name = None
-    if char_class.lower() == "netrunner":
-        art_name = "netrunner"
-    elif char_class.lower() == "street samurai":
-        art_name = "street_samurai"
-    elif char_class.lower() == "techie":
-        art_name = "techie"
-    elif char_class.lower() == "fixer":
-        art_name = "fixer"
-    
-    # Fallback to hacker if no specific art found
-    char_art = assets.get_ascii_art(art_name if art_name else "hacker")
+    # Get character ASCII art (falls back to hacker for unknown classes)
+    char_art = assets.get_ascii_art(art_name)
     
     # Use neural interface animation as intro
     neural_interface(console, message="NEURAL LINK ESTABLISHED", duration=1.5)
     
     # Glitchy scanning effect
     console.print()
-    glitch_text("SCANNING NEURAL IDENTITY...", console, style=Style(color="#00FFAA"))
+    glitch_text("SCANNING NEURAL IDENTITY...", console, style=_style("#00FFAA"))
     time.sleep(0.5)
     
     # Character class reveal with typing effect
     console.print()
     # Don't use Rich markup inside typing_effect - create a non-markup version instead
-    typing_effect(f"CLASS IDENTIFIED: {char_class.upper()}", console, style=Style(color="#FF00AA", bold=True))
+    typing_effect(f"CLASS IDENTIFIED: {char_class.upper()}", console, style=_style("#FF00AA", bold=True))
     time.sleep(0.5)
     
     # Name reveal if provided
     if name:
         console.print()
-        typing_effect(f"IDENTITY: {name.upper()}", console, style=Style(color="#00AAFF", bold=True))
+        typing_effect(f"IDENTITY: {name.upper()}", console, style=_style("#00AAFF", bold=True))
         time.sleep(0.5)
     
     # Show character art with a neon effect
@@ -1034,21 +1196,11 @@ def character_introduction(console, char_class, name=None):
     if char_art:
         # Create a Text object to prevent markup interpretation
         char_art_text = Text(char_art)
-        console.print(char_art_text, style=Style(color="#00FFAA"))
+        console.print(char_art_text, style=_style("#00FFAA"))
     
     # Class description with typing effect
     console.print()
-    description = ""
-    if char_class.lower() == "netrunner":
-        description = "Specialist in hacking and digital infiltration. Exceptional at bypassing security and manipulating data."
-    elif char_class.lower() == "street samurai":
-        description = "Augmented fighter with unmatched combat skills. Cybernetic enhancements provide superior strength and reflexes."
-    elif char_class.lower() == "techie":
-        description = "Expert in technology repair and improvised gadgets. Can create useful tools from scavenged parts."
-    elif char_class.lower() == "fixer":
-        description = "Connected dealer, negotiator, and information broker. Knows who to talk to and how to make deals."
-    
-    typing_effect(description, console, style=Style(color="#AAAAFF"))
+    typing_effect(description, console, style=_style("#AAAAFF"))
     
     # Final flourish
     console.print()
@@ -1056,7 +1208,7 @@ def character_introduction(console, char_class, name=None):
     console.print()
     # Create a Text object to prevent markup interpretation
     final_text = Text("READY FOR OPERATION. GOOD LUCK, RUNNER.")
-    typing_effect(final_text, console, style=Style(color="#00FFAA"))
+    typing_effect(final_text, console, style=_style("#00FFAA"))
     console.print()
 
 def data_stream(text, console, style=None, stream_chars="10"):
@@ -1069,46 +1221,41 @@ def data_stream(text, console, style=None, stream_chars="10"):
         style: Style to apply to the text
         stream_chars: Characters to use in the data stream
     """
-    # Import at the start to ensure it's available for all code paths
-    from rich.text import Text
-    
-    if not ANIMATION_SETTINGS["enabled"]:
-        # Create a Text object to prevent rich markup interpretation even when animation is disabled
-        text_obj = Text(text)
-        console.print(text_obj, style=style)
+    if _skip_animation(console):
+        # Print the plain string with markup, emoji and highlighting off
+        console.print(text, style=style, markup=False, emoji=False, highlight=False)
         return
     
     delay = get_animation_delay() * 0.8
     stream_length = 30
     
-    # Create streams of data that will appear to flow
+    visible = 20
+    
+    # Create streams of data that will appear to flow. Each is stored with its
+    # first visible chars repeated at the end, so rotating the stream is just
+    # sliding a window along it from a shared offset
     streams = []
-    for _ in range(5):
-        stream = ""
-        for _ in range(stream_length):
-            stream += random.choice(stream_chars)
-        streams.append(stream)
+    for _ in _STREAM_STYLES:
+        stream = _random_chars(stream_chars, stream_length)
+        streams.append(stream + stream[:visible])
+    offset = 0
     
     # Animate data streams flowing before showing text
+    wait_frame = _frame_schedule(delay)
     for i in range(20):
         # Move each stream and print it
-        for s_idx, stream in enumerate(streams):
-            # Rotate the stream to create flowing effect
-            streams[s_idx] = stream[1:] + stream[0]
-            
-            # Print with varying intensity
-            intensity = 155 + int((s_idx / len(streams)) * 100)  # Vary from 155-255
-            color = f"#00{intensity:02X}00"  # Green with varying intensity
-            
-            # Create a Text object to prevent rich markup interpretation
-            text_obj = Text(streams[s_idx][:20])
-            console.print(text_obj, style=Style(color=color))
+        offset = (offset + 1) % stream_length
+        segments = []
+        for stream, stream_style in zip(streams, _STREAM_STYLES):
+            segments.append((stream[offset:offset + visible] + "\n", stream_style))
         
-        time.sleep(delay)
+        # Assemble the frame into one Text (no markup interpretation) and print it once
+        console.print(Text.assemble(*segments), end="")
+        
+        wait_frame()
         
         # Move cursor back to beginning
-        for _ in range(len(streams)):
-            sys.stdout.write("\033[F")
+        sys.stdout.write(_cursor_up(len(streams)))
     
     # Display the actual text
     # Create a Text object for the main text to prevent rich markup interpretation
@@ -1116,29 +1263,21 @@ def data_stream(text, console, style=None, stream_chars="10"):
     console.print(text_obj, style=style)
     
     # More streaming data after the text (just a brief flash)
+    wait_frame = _frame_schedule(delay)
     for i in range(5):
-        for s_idx, stream in enumerate(streams):
-            # Rotate the stream to create flowing effect
-            streams[s_idx] = stream[1:] + stream[0]
-            
-            # Print with varying intensity
-            intensity = 155 + int((s_idx / len(streams)) * 100)  # Vary from 155-255
-            color = f"#00{intensity:02X}00"  # Green with varying intensity
-            
-            # Create a Text object to prevent rich markup interpretation
-            text_obj = Text(streams[s_idx][:20])
-            console.print(text_obj, style=Style(color=color))
+        offset = (offset + 1) % stream_length
+        segments = []
+        for stream, stream_style in zip(streams, _STREAM_STYLES):
+            segments.append((stream[offset:offset + visible] + "\n", stream_style))
         
-        time.sleep(delay)
+        # Assemble the frame into one Text (no markup interpretation) and print it once
+        console.print(Text.assemble(*segments), end="")
+        
+        wait_frame()
         
         # Move cursor back to beginning
-        for _ in range(len(streams)):
-            sys.stdout.write("\033[F")
+        sys.stdout.write(_cursor_up(len(streams)))
     
-    # Clear the streams
-    for _ in range(len(streams)):
-        console.print(" " * 20)
-        
-    # Move cursor back to beginning
-    for _ in range(len(streams)):
-        sys.stdout.write("\033[F")
\ No newline at end of file
+    # Clear the streams and move cursor back to beginning, in a single write
+    sys.stdout.write((" " * visible + "\n") * len(streams) + _cursor_up(len(streams)))
+    sys.stdout.flush()
\ No newline at end of file
@@ -5,6 +5,7 @@ import os
 import json
 from data.ascii_art import ASCII_ART
 
-def get_ascii_art(art_name):
+def get_ascii_art(art_name, _get=ASCII_ART.get):
     """Get ASCII art by name"""
-    return ASCII_ART.get(art_name, "")
+    # _get binds the dict's lookup once at definition time
+    return _get(art_name, "")
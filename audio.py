@@ -2,14 +2,14 @@
 Audio Module - Handles music and sound effects for the game
 """
 import os
+import heapq
+import itertools
+import random
 import threading
 import pygame
 import time
 from pathlib import Path
 
-# Initialize pygame mixer
-pygame.mixer.init()
-
 # Create directories if they don't exist
 os.makedirs('sounds/music', exist_ok=True)
 os.makedirs('sounds/effects', exist_ok=True)
@@ -24,9 +24,133 @@ effects_enabled = True
 # Sound effects cache
 sound_effects = {}
 
-def initialize():
-    """Initialize the audio system"""
-    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+# Ambient playback: a single scheduler thread serves every ambient type from
+# a min-heap of (due time, order, sounds, channel, interval_min, interval_max)
+# entries.
+# The condition guards the heap and wakes the scheduler when it changes
+_ambient_heap = []
+_ambient_order = itertools.count()
+_ambient_wakeup = threading.Condition()
+_ambient_scheduler = None
+
+# Mixer channels: a fixed pool allocated once, with the first AMBIENT_CHANNELS
+# reserved for ambient sounds so game effects never steal them (and vice
+# versa). Each ambient type gets its own reserved channel, since a Channel
+# only holds one queued sound and types that come due together would
+# otherwise replace each other's
+EFFECT_CHANNELS = 16
+AMBIENT_CHANNELS = 4
+_ambient_channels = ()
+_ambient_type_channels = {}
+
+# Mixer output buffer in samples: lower is lower latency (buffer / 44100 s),
+# higher is safer against dropouts on a loaded system. The default can be
+# overridden by GAME_SETTINGS['audio_buffer']; if the device rejects a size,
+# it's doubled up to MAX_MIXER_BUFFER
+MIXER_BUFFER = 1024
+MAX_MIXER_BUFFER = 4096
+
+# The mixer is started on first use rather than at import
+_mixer_ready = False
+
+def _ensure_mixer():
+    """Start the mixer with the game's settings, once, the first time audio is needed"""
+    global _mixer_ready, _ambient_channels
+    if _mixer_ready:
+        return
+    if pygame.mixer.get_init():
+        # Started elsewhere with other settings; init() would silently keep them
+        pygame.mixer.quit()
+    
+    buffer_size = MIXER_BUFFER
+    try:
+        from config import GAME_SETTINGS
+        buffer_size = int(GAME_SETTINGS.get('audio_buffer', MIXER_BUFFER))
+    except (ImportError, ValueError, TypeError):
+        pass
+    
+    while True:
+        try:
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=buffer_size)
+            break
+        except pygame.error:
+            if buffer_size * 2 > MAX_MIXER_BUFFER:
+                raise
+            buffer_size *= 2
+    
+    pygame.mixer.set_num_channels(EFFECT_CHANNELS)
+    pygame.mixer.set_reserved(AMBIENT_CHANNELS)
+    _ambient_channels = tuple(pygame.mixer.Channel(index) for index in range(AMBIENT_CHANNELS))
+    _mixer_ready = True
+
+# Names (without extension) of the available sound files, so playback can
+# check membership instead of hitting the filesystem on every call
+_effect_files = frozenset()
+_music_files = frozenset()
+
+# Effects over this size aren't decoded up front: Sound() holds the whole
+# decoded file in RAM, so big files are loaded only if they're actually played.
+# Music never goes through Sound(); pygame.mixer.music streams it from disk
+LARGE_EFFECT_BYTES = 1 << 20
+_large_effect_files = frozenset()
+
+# Effect names grouped by the prefix before their first "_" (city_siren is
+# a "city" sound), for picking ambient sounds without rescanning the directory
+_ambient_by_type = {}
+
+def _scan_sounds(directory, extension):
+    """Map the names of the sound files with the given extension in a directory to their sizes"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name[:-len(extension)]: entry.stat().st_size for entry in entries
+                    if entry.name.endswith(extension) and entry.is_file()}
+    except OSError:
+        return {}
+
+def refresh_audio_manifest():
+    """Rescan the sound directories, e.g. after new sound files are added"""
+    global _effect_files, _music_files, _large_effect_files, _ambient_by_type
+    effect_sizes = _scan_sounds(os.path.join('sounds', 'effects'), '.wav')
+    _effect_files = frozenset(effect_sizes)
+    _large_effect_files = frozenset(name for name, size in effect_sizes.items()
+                                    if size > LARGE_EFFECT_BYTES)
+    _music_files = frozenset(_scan_sounds(os.path.join('sounds', 'music'), '.mp3'))
+    
+    ambient_by_type = {}
+    for sound_name in sorted(_effect_files):
+        prefix, separator, _ = sound_name.partition('_')
+        if separator:
+            ambient_by_type.setdefault(prefix, []).append(sound_name)
+    _ambient_by_type = {prefix: tuple(names) for prefix, names in ambient_by_type.items()}
+
+refresh_audio_manifest()
+
+def _load_effect(sound_name):
+    """Decode a sound effect into the cache, at the current effects volume"""
+    _ensure_mixer()
+    sound = pygame.mixer.Sound(os.path.join('sounds', 'effects', f"{sound_name}.wav"))
+    sound.set_volume(effects_volume)
+    sound_effects[sound_name] = sound
+    return sound
+
+def preload_effects():
+    """Decode the sound effects up front, so the first play doesn't stutter"""
+    for sound_name in _effect_files - _large_effect_files:
+        if sound_name not in sound_effects:
+            try:
+                _load_effect(sound_name)
+            except Exception as e:
+                print(f"Error loading sound effect {sound_name}: {e}")
+
+def initialize(preload=True):
+    """
+    Initialize the audio system
+    
+    Args:
+        preload (bool): Decode all sound effects now rather than on first play
+    """
+    _ensure_mixer()
+    refresh_audio_manifest()
     
     # Load settings from config if available
     global music_volume, effects_volume, music_enabled, effects_enabled
@@ -39,6 +163,16 @@ def initialize():
     except (ImportError, KeyError):
         # Use defaults if settings aren't available
         pass
+    
+    if not effects_enabled:
+        stop_ambient_sounds()
+    
+    # Bring any sounds loaded before initialization in line with the settings
+    for sound in sound_effects.values():
+        sound.set_volume(effects_volume)
+    
+    if preload:
+        preload_effects()
 
 def play_music(track_name, loop=True):
     """
@@ -52,21 +186,21 @@ def play_music(track_name, loop=True):
         return
         
     global current_music
+    _ensure_mixer()
     
     # Stop any currently playing music
-    if pygame.mixer.music.get_busy():
-        pygame.mixer.music.stop()
+    pygame.mixer.music.stop()
     
     # Full path to the music file
     music_path = os.path.join('sounds', 'music', f"{track_name}.mp3")
     
     # Check if the music file exists
-    if not os.path.exists(music_path):
+    if track_name not in _music_files:
         print(f"Warning: Music file not found: {music_path}")
         return
     
     try:
-        # Load and play the music
+        # Load and play the music; music.load streams from disk, unlike Sound()
         pygame.mixer.music.load(music_path)
         pygame.mixer.music.set_volume(music_volume)
         pygame.mixer.music.play(-1 if loop else 0)
@@ -76,38 +210,43 @@ def play_music(track_name, loop=True):
 
 def stop_music():
     """Stop currently playing music"""
-    if pygame.mixer.music.get_busy():
+    if _mixer_ready:
         pygame.mixer.music.stop()
     
     global current_music
     current_music = None
 
-def play_sound(sound_name):
+def play_sound(sound_name, ambient_channel=None):
     """
     Play a sound effect
     
     Args:
         sound_name (str): Name of the sound effect to play
+        ambient_channel (int, optional): Index of the reserved ambient channel
+            to play on; by default the sound plays on any free channel
     """
     if not effects_enabled:
         return
-        
-    # Full path to the sound file
-    sound_path = os.path.join('sounds', 'effects', f"{sound_name}.wav")
     
     # Check if the sound file exists
-    if not os.path.exists(sound_path):
+    if sound_name not in _effect_files:
+        sound_path = os.path.join('sounds', 'effects', f"{sound_name}.wav")
         print(f"Warning: Sound effect not found: {sound_path}")
         return
     
     try:
-        # Cache the sound if not already loaded
-        if sound_name not in sound_effects:
-            sound_effects[sound_name] = pygame.mixer.Sound(sound_path)
+        # Cache the sound if not already loaded (its volume is set on load)
+        sound = sound_effects.get(sound_name)
+        if sound is None:
+            sound = _load_effect(sound_name)
         
         # Play the sound
-        sound_effects[sound_name].set_volume(effects_volume)
-        sound_effects[sound_name].play()
+        if ambient_channel is not None:
+            # Queue behind this type's ambient sound if it's still playing
+            # rather than cutting it off
+            _ambient_channels[ambient_channel].queue(sound)
+        else:
+            sound.play()
     except Exception as e:
         print(f"Error playing sound effect: {e}")
 
@@ -120,7 +259,8 @@ def set_music_volume(volume):
     """
     global music_volume
     music_volume = max(0.0, min(1.0, volume))
-    pygame.mixer.music.set_volume(music_volume)
+    if _mixer_ready:
+        pygame.mixer.music.set_volume(music_volume)
     
     # Update settings
     try:
@@ -137,7 +277,12 @@ def set_effects_volume(volume):
         volume (float): Volume level (0.0 to 1.0)
     """
     global effects_volume
-    effects_volume = max(0.0, min(1.0, volume))
+    volume = max(0.0, min(1.0, volume))
+    if volume != effects_volume:
+        effects_volume = volume
+        # Loaded sounds keep their volume, so only touch them on a change
+        for sound in sound_effects.values():
+            sound.set_volume(effects_volume)
     
     # Update settings
     try:
@@ -151,7 +296,7 @@ def toggle_music():
     global music_enabled
     music_enabled = not music_enabled
     
-    if not music_enabled and pygame.mixer.music.get_busy():
+    if not music_enabled and _mixer_ready:
         pygame.mixer.music.stop()
     elif music_enabled and current_music:
         play_music(current_music)
@@ -170,6 +315,10 @@ def toggle_effects():
     global effects_enabled
     effects_enabled = not effects_enabled
     
+    # Ambient sounds stop with the effects
+    if not effects_enabled:
+        stop_ambient_sounds()
+    
     # Update settings
     try:
         from settings import update_setting
@@ -179,9 +328,50 @@ def toggle_effects():
     
     return effects_enabled
 
+def _ambient_loop():
+    """Play each scheduled ambient type's sounds as they come due, forever"""
+    # Bind the per-wakeup callables and the (never rebound) scheduler state to
+    # locals; effects_enabled stays a global read since settings rebind it
+    choice = random.choice
+    uniform = random.uniform
+    monotonic = time.monotonic
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    play = play_sound
+    heap = _ambient_heap
+    wakeup = _ambient_wakeup
+    order = _ambient_order
+    
+    while True:
+        with wakeup:
+            # Sleep until the earliest entry is due (or the heap changes)
+            while True:
+                if not heap:
+                    wakeup.wait()
+                    continue
+                remaining = heap[0][0] - monotonic()
+                if remaining <= 0:
+                    break
+                wakeup.wait(remaining)
+            _, _, sounds, channel, interval_min, interval_max = heappop(heap)
+        
+        play(choice(sounds), ambient_channel=channel)
+        
+        # Schedule this type's next sound after a random interval
+        with wakeup:
+            if effects_enabled:
+                heappush(heap, (monotonic() + uniform(interval_min, interval_max),
+                                next(order), sounds, channel, interval_min, interval_max))
+
+def stop_ambient_sounds():
+    """Cancel every scheduled ambient sound"""
+    with _ambient_wakeup:
+        _ambient_heap.clear()
+        _ambient_wakeup.notify()
+
 def play_ambient_sounds(ambient_type, interval_min=5, interval_max=15):
     """
-    Start a thread that plays ambient sounds at random intervals
+    Schedule ambient sounds of a type to play at random intervals
     
     Args:
         ambient_type (str): Type of ambient sounds to play (e.g., 'city', 'combat')
@@ -189,30 +379,33 @@ def play_ambient_sounds(ambient_type, interval_min=5, interval_max=15):
         interval_max (int): Maximum interval between sounds in seconds
     
     Returns:
-        threading.Thread: The ambient sounds thread
+        threading.Thread: The ambient scheduler thread, shared by all types
     """
-    import random
+    global _ambient_scheduler
+    
+    ambient_sounds = _ambient_by_type.get(ambient_type)
+    if ambient_sounds is None:
+        # Multi-word types like "city_night" aren't indexed by prefix
+        ambient_sounds = tuple(name for name in _effect_files if name.startswith(f"{ambient_type}_"))
     
-    def ambient_thread():
-        ambient_sounds = [f for f in os.listdir(os.path.join('sounds', 'effects')) 
-                         if f.startswith(f"{ambient_type}_") and f.endswith(".wav")]
+    with _ambient_wakeup:
+        # Start the scheduler on first use
+        if _ambient_scheduler is None:
+            _ambient_scheduler = threading.Thread(target=_ambient_loop, name="ambient-sounds", daemon=True)
+            _ambient_scheduler.start()
         
-        while effects_enabled:
-            if ambient_sounds:
-                # Play a random ambient sound
-                sound_file = random.choice(ambient_sounds).replace('.wav', '')
-                play_sound(sound_file)
-                
-                # Wait for a random interval
-                time.sleep(random.uniform(interval_min, interval_max))
-            else:
-                # No ambient sounds found, exit thread
-                break
-    
-    # Start the ambient thread
-    thread = threading.Thread(target=ambient_thread, daemon=True)
-    thread.start()
-    return thread
+        # No ambient sounds found (or effects off) means there's nothing to schedule
+        if ambient_sounds and effects_enabled:
+            # Give each type its own ambient channel, sharing only past AMBIENT_CHANNELS types
+            channel = _ambient_type_channels.setdefault(
+                ambient_type, len(_ambient_type_channels) % AMBIENT_CHANNELS)
+            
+            # The first sound plays right away
+            heapq.heappush(_ambient_heap, (time.monotonic(), next(_ambient_order),
+                                           ambient_sounds, channel, interval_min, interval_max))
+            _ambient_wakeup.notify()
+    
+    return _ambient_scheduler
 
 # Create example sound files for testing if they don't exist
 def create_example_sounds():
@@ -221,49 +414,68 @@ def create_example_sounds():
         from scipy.io import wavfile
         import numpy as np
         
-        # Create a simple beep sound
         sample_rate = 44100
-        duration = 0.5
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        effects_dir = os.path.join('sounds', 'effects')
+        
+        # One shared time ramp, long enough for the longest sound; every
+        # sound works on a prefix slice of it instead of its own linspace
+        t = np.arange(int(sample_rate * 2.0), dtype=np.float32) / sample_rate
+        
+        def ramp(duration):
+            return t[:int(sample_rate * duration)]
         
-        # Generate a 440 Hz sine wave
-        beep = np.sin(2 * np.pi * 440 * t) * 0.5
+        def save(name, wave):
+            """Write a float wave in [-1, 1] as 16-bit PCM, the mixer's native format"""
+            wave *= 32767
+            wavfile.write(os.path.join(effects_dir, f'{name}.wav'), sample_rate, wave.astype(np.int16))
         
-        # Save as a WAV file
-        wavfile.write(os.path.join('sounds', 'effects', 'beep.wav'), sample_rate, beep.astype(np.float32))
+        # Create a simple beep sound: a 440 Hz sine wave
+        t_short = ramp(0.5)
+        beep = np.sin((2 * np.pi * 440) * t_short)
+        beep *= 0.5
+        save('beep', beep)
         
         # Create more sound effects
         # Menu selection sound
-        menu_select = np.sin(2 * np.pi * 880 * t) * 0.3
-        wavfile.write(os.path.join('sounds', 'effects', 'menu_select.wav'), sample_rate, menu_select.astype(np.float32))
+        menu_select = np.sin((2 * np.pi * 880) * t_short)
+        menu_select *= 0.3
+        save('menu_select', menu_select)
         
-        # Combat hit sound
-        duration = 0.2
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        hit = np.sin(2 * np.pi * 220 * t) * 0.8 * np.exp(-5 * t)
-        wavfile.write(os.path.join('sounds', 'effects', 'combat_hit.wav'), sample_rate, hit.astype(np.float32))
+        # Combat hit sound, decaying
+        t_hit = ramp(0.2)
+        hit = np.sin((2 * np.pi * 220) * t_hit)
+        hit *= np.exp(-5 * t_hit)
+        hit *= 0.8
+        save('combat_hit', hit)
         
-        # Item pickup sound
+        # Item pickup sound: a chirp from 500 to 1200 Hz. The phase is the
+        # integral of the rising frequency, so the sweep really ends at 1200 Hz
         duration = 0.3
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        pickup = np.sin(2 * np.pi * np.linspace(500, 1200, len(t)) * t) * 0.5
-        wavfile.write(os.path.join('sounds', 'effects', 'item_pickup.wav'), sample_rate, pickup.astype(np.float32))
+        t_pickup = ramp(duration)
+        pickup = np.sin((2 * np.pi) * (500 * t_pickup + (1200 - 500) / (2 * duration) * t_pickup * t_pickup))
+        pickup *= 0.5
+        save('item_pickup', pickup)
         
-        # Ambient city sounds
-        duration = 2.0
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        city1 = (np.random.rand(len(t)) - 0.5) * 0.2 + np.sin(2 * np.pi * 50 * t) * 0.1
-        wavfile.write(os.path.join('sounds', 'effects', 'city_ambient1.wav'), sample_rate, city1.astype(np.float32))
+        # Ambient city sounds: noise over a low hum
+        rng = np.random.default_rng()
+        t_city = ramp(2.0)
+        city1 = rng.random(len(t_city), dtype=np.float32) - 0.5
+        city1 *= 0.2
+        city1 += np.sin((2 * np.pi * 50) * t_city) * 0.1
+        save('city_ambient1', city1)
         
-        duration = 1.5
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        city2 = (np.random.rand(len(t)) - 0.5) * 0.3 + np.sin(2 * np.pi * 30 * t) * 0.1
-        wavfile.write(os.path.join('sounds', 'effects', 'city_ambient2.wav'), sample_rate, city2.astype(np.float32))
+        t_city = ramp(1.5)
+        city2 = rng.random(len(t_city), dtype=np.float32) - 0.5
+        city2 *= 0.3
+        city2 += np.sin((2 * np.pi * 30) * t_city) * 0.1
+        save('city_ambient2', city2)
         
         print("Created example sound effects.")
+        refresh_audio_manifest()
     except ImportError:
         print("Could not create example sounds: scipy not installed")
         
         # Create empty files as placeholders
         for sound in ['beep', 'menu_select', 'combat_hit', 'item_pickup', 'city_ambient1', 'city_ambient2']:
-            open(os.path.join('sounds', 'effects', f'{sound}.wav'), 'w').close()
\ No newline at end of file
+            open(os.path.join('sounds', 'effects', f'{sound}.wav'), 'w').close()
+        refresh_audio_manifest()
\ No newline at end of file
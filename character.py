@@ -2,7 +2,7 @@
 Character Module - Player character functionality
 """
 import json
-import time
+from types import MappingProxyType
 from rich.console import Console
 
 import inventory
@@ -10,9 +10,58 @@ from config import LEVEL_UP_BASE_XP
 from districts import ReputationSystem
 from skills import CharacterProgression, SkillTree
 
+# XP needed to leave each level, precomputed as integers (index = level - 1)
+_XP_TABLE = tuple(int(LEVEL_UP_BASE_XP * level * 1.5) for level in range(1, 101))
+
+# combat's ability table, resolved on first use rather than imported per call,
+# plus an index from ability display name to its data (first class wins)
+_CLASS_ABILITIES = None
+_ABILITY_BY_NAME = {}
+
+# Effect given to a skill/perk ability that no class defines, by the first
+# keyword (in priority order) found in its lowercased name
+_FALLBACK_ABILITY_EFFECTS = (
+    ("damage", "damage_multiplier", 1.5),
+    ("attack", "damage_multiplier", 1.5),
+    ("defense", "defense_boost", 3),
+    ("protect", "defense_boost", 3),
+    ("heal", "self_heal", 10)
+)
+
+def _get_class_abilities():
+    """Return combat.CLASS_ABILITIES, importing it the first time"""
+    global _CLASS_ABILITIES
+    if _CLASS_ABILITIES is None:
+        from combat import CLASS_ABILITIES
+        _CLASS_ABILITIES = CLASS_ABILITIES
+        for abilities in CLASS_ABILITIES.values():
+            for data in abilities.values():
+                if 'name' in data:
+                    _ABILITY_BY_NAME.setdefault(data['name'], data)
+    return _CLASS_ABILITIES
+
+def _xp_for_next_level(level):
+    """Return the XP threshold for leaving the given level"""
+    if level <= len(_XP_TABLE):
+        return _XP_TABLE[level - 1]
+    return int(LEVEL_UP_BASE_XP * level * 1.5)
+
 class Character:
     """Player character class with stats and inventory"""
     
+    # Fixed attribute layout; 'abilities' is only assigned by the demo scripts
+    __slots__ = (
+        'name', 'char_class', 'stats', 'level', 'experience', 'max_health',
+        'health', 'credits', 'inventory', 'status_effects', 'turn_counter',
+        '_next_effect_id', 'reputation', 'skill_tree', 'progression',
+        'combat_stance', 'current_cover', 'ability_cooldowns',
+        'drone_damage', 'drone_turns', 'analyzed_enemy', 'focus_bonus', 'defense_bonus',
+        'weaknesses', 'resistances', 'cover_health', 'position',
+        'current_environment', 'active_hazards', 'target_zone',
+        'tactical_advantage', 'ammo_type', 'combo_points', 'abilities',
+        '_class_abilities'
+    )
+    
     def __init__(self, name, char_class, stats=None):
         """Initialize a new character"""
         self.name = name
@@ -29,15 +78,17 @@ class Character:
         # Core attributes
         self.level = 1
         self.experience = 0
-        self.max_health = 10 + self.stats.get("strength", 0) * 2
+        self.max_health = self._base_max_health()
         self.health = self.max_health
         self.credits = 100
         
         # Create inventory
         self.inventory = inventory.Inventory()
         
-        # Character status effects
+        # Character status effects, keyed by integer id and expiring by turn
         self.status_effects = {}
+        self.turn_counter = 0
+        self._next_effect_id = 0
         
         # Reputation system
         self.reputation = ReputationSystem()
@@ -59,14 +110,12 @@ class Character:
         # Special abilities cooldowns (turns remaining)
         self.ability_cooldowns = {}
         
-        # Active effects (drones, temporary buffs, etc.)
-        self.active_effects = {
-            "drone_damage": 0,      # Extra damage from deployed drone
-            "drone_turns": 0,       # Turns remaining for drone
-            "analyzed_enemy": None, # Enemy that has been analyzed
-            "focus_bonus": 0,       # Critical hit chance bonus
-            "defense_bonus": 0      # Bonus to defense value
-        }
+        # Active effects (drones, temporary buffs, etc.), saved as active_effects
+        self.drone_damage = 0           # Extra damage from deployed drone
+        self.drone_turns = 0            # Turns remaining for drone
+        self.analyzed_enemy = None      # Enemy that has been analyzed
+        self.focus_bonus = 0            # Critical hit chance bonus
+        self.defense_bonus = 0          # Bonus to defense value
         
         # Weaknesses and resistances (for advanced combat)
         self.weaknesses = []
@@ -105,7 +154,19 @@ class Character:
         character.inventory = inventory.Inventory.from_dict(data.get('inventory', {}))
         
         # Load status effects
-        character.status_effects = data.get('status_effects', {})
+        # JSON turns the integer effect ids into strings; restore them
+        character.status_effects = {
+            int(effect_id) if isinstance(effect_id, str) and effect_id.isdigit() else effect_id: effect
+            for effect_id, effect in data.get('status_effects', {}).items()
+        }
+        character.turn_counter = data.get('turn_counter', 0)
+        # Saves without a stored counter continue past the highest restored id
+        restored_ids = [effect_id for effect_id in character.status_effects if isinstance(effect_id, int)]
+        character._next_effect_id = data.get('next_effect_id', max(restored_ids, default=-1) + 1)
+        for effect in character.status_effects.values():
+            # Older saves stored wall-clock timestamps; restart those on the turn clock
+            if 'expires_at' not in effect and effect.get('duration', 0) > 0:
+                effect['expires_at'] = character.turn_counter + effect['duration']
         
         # Load reputation
         if 'reputation' in data:
@@ -123,11 +184,7 @@ class Character:
         character.combat_stance = data.get('combat_stance', 'offensive')
         character.current_cover = data.get('current_cover', 'none')
         character.ability_cooldowns = data.get('ability_cooldowns', {})
-        character.active_effects = data.get('active_effects', {
-            'drone_damage': 0,
-            'drone_turns': 0,
-            'analyzed_enemy': None
-        })
+        character.active_effects = data.get('active_effects', {})
         
         # Re-initialize abilities in case the character class has new ones
         character._init_class_abilities()
@@ -147,14 +204,44 @@ class Character:
             'credits': self.credits,
             'inventory': self.inventory.to_dict(),
             'status_effects': self.status_effects,
+            'turn_counter': self.turn_counter,
+            'next_effect_id': self._next_effect_id,
             'reputation': self.reputation.to_dict(),
             'progression': self.progression.to_dict(),
             'combat_stance': self.combat_stance,
             'current_cover': self.current_cover,
             'ability_cooldowns': self.ability_cooldowns,
-            'active_effects': self.active_effects
+            'active_effects': dict(self.active_effects)
         }
     
+    @property
+    def active_effects(self):
+        """The active combat effects, in the form they're saved in
+        
+        The view is read-only: it is rebuilt from the attributes on each access,
+        so change an effect through its attribute (e.g. self.focus_bonus) or
+        assign a whole dict to active_effects.
+        """
+        return MappingProxyType({
+            'drone_damage': self.drone_damage,
+            'drone_turns': self.drone_turns,
+            'analyzed_enemy': self.analyzed_enemy,
+            'focus_bonus': self.focus_bonus,
+            'defense_bonus': self.defense_bonus
+        })
+    
+    @active_effects.setter
+    def active_effects(self, effects):
+        self.drone_damage = effects.get('drone_damage', 0)
+        self.drone_turns = effects.get('drone_turns', 0)
+        self.analyzed_enemy = effects.get('analyzed_enemy')
+        self.focus_bonus = effects.get('focus_bonus', 0)
+        self.defense_bonus = effects.get('defense_bonus', 0)
+    
+    def _base_max_health(self):
+        """Max health before level bonuses: 10 plus two per point of strength"""
+        return 10 + self.stats.get("strength", 0) * 2
+    
     def add_experience(self, amount, audio_system=None):
         """Add experience and handle level ups"""
         if amount <= 0:
@@ -165,12 +252,17 @@ class Character:
         # Also award experience to progression system
         progression_rewards = self.progression.award_experience(amount)
         
-        # Check for level up
-        xp_for_next_level = LEVEL_UP_BASE_XP * (self.level * 1.5)
-        
-        if self.experience >= xp_for_next_level:
-            level_up_info = self.level_up()
-            
+        # Check for level up, allowing several levels from one large award
+        level_up_info = None
+        while self.experience >= _xp_for_next_level(self.level):
+            info = self.level_up()
+            if level_up_info:
+                info['health_increase'] += level_up_info['health_increase']
+                info['skill_points_gained'] += level_up_info['skill_points_gained']
+                info['perk_points_gained'] += level_up_info['perk_points_gained']
+            level_up_info = info
+        
+        if level_up_info:
             # Play level up sound if audio system is available
             if audio_system:
                 audio_system.play_sound("level_up")
@@ -189,7 +281,7 @@ class Character:
         
         # Increase max health
         old_max_health = self.max_health
-        self.max_health = 10 + (self.stats.get("strength", 0) * 2) + (self.level * 2)
+        self.max_health = self._base_max_health() + self.level * 2
         health_increase = self.max_health - old_max_health
         
         # Heal to full on level up
@@ -235,57 +327,61 @@ class Character:
         
         # Process item effects
         effects = item_info.get('effects', {})
+        health_effect = effects.get('health')
+        special = effects.get('special')
+        
+        # Collect the effect messages and print them together
+        messages = []
         
         # Health effect
-        if 'health' in effects:
+        if health_effect is not None:
             old_health = self.health
-            self.health = min(self.max_health, self.health + effects['health'])
+            self.health = min(self.max_health, self.health + health_effect)
             health_gain = self.health - old_health
             
-            console.print(f"[green]Restored {health_gain} health[/green]")
-        
-        # Stat effects
+            messages.append(f"[green]Restored {health_gain} health[/green]")
+        
+        # Stat effects; everything that's the same for each stat is read once
+        stats = self.stats
+        status_effects = self.status_effects
+        add_message = messages.append
+        permanent = effects.get('permanent', False)
+        duration = effects.get('duration', 3)
+        expires_at = self.turn_counter + duration
         for stat, value in effects.get('stats', {}).items():
-            if stat in self.stats:
-                old_value = self.stats[stat]
-                
+            if stat in stats:
                 # Apply stat bonus
-                if 'permanent' in effects and effects['permanent']:
+                if permanent:
                     # Permanent stat increase
-                    self.stats[stat] += value
-                    console.print(f"[green]Permanently increased {stat} by {value}[/green]")
+                    stats[stat] += value
+                    add_message(f"[green]Permanently increased {stat} by {value}[/green]")
                 else:
-                    # Temporary stat boost
-                    duration = effects.get('duration', 3)
-                    
-                    # Add status effect
-                    effect_id = f"{stat}_boost_{time.time()}"
-                    self.status_effects[effect_id] = {
+                    # Temporary stat boost, tracked as a status effect
+                    status_effects[self._new_effect_id()] = {
                         'type': 'stat_boost',
                         'stat': stat,
                         'value': value,
                         'duration': duration,
-                        'applied_at': time.time()
+                        'expires_at': expires_at
                     }
                     
-                    console.print(f"[green]Boosted {stat} by {value} for {duration} turns[/green]")
+                    add_message(f"[green]Boosted {stat} by {value} for {duration} turns[/green]")
         
         # Special effects
-        if 'special' in effects:
-            special = effects['special']
-            
+        if special is not None:
             if special == 'reveal_map':
-                console.print("[green]Map revealed in your current area[/green]")
+                messages.append("[green]Map revealed in your current area[/green]")
             elif special == 'remove_status':
-                # Remove negative status effects
-                removed = 0
-                for effect_id in list(self.status_effects.keys()):
-                    effect = self.status_effects[effect_id]
-                    if effect.get('negative', False):
-                        del self.status_effects[effect_id]
-                        removed += 1
+                # Remove negative status effects by rebuilding without them
+                kept_effects = {effect_id: effect for effect_id, effect in self.status_effects.items()
+                                if not effect.get('negative', False)}
+                removed = len(self.status_effects) - len(kept_effects)
+                self.status_effects = kept_effects
                 
-                console.print(f"[green]Removed {removed} negative status effects[/green]")
+                messages.append(f"[green]Removed {removed} negative status effects[/green]")
+        
+        if messages:
+            console.print("\n".join(messages))
         
         # Remove the item from inventory
         self.inventory.remove_item(item_name, 1)
@@ -293,11 +389,11 @@ class Character:
         # Play appropriate sound effect if audio system is available
         if audio_system:
             # Select sound based on item type
-            if 'health' in effects:
+            if health_effect is not None:
                 audio_system.play_sound("item_pickup")  # Use pickup sound for healing items
-            elif 'special' in effects and effects['special'] == 'reveal_map':
+            elif special == 'reveal_map':
                 audio_system.play_sound("skill_success")
-            elif 'special' in effects and effects['special'] == 'remove_status':
+            elif special == 'remove_status':
                 audio_system.play_sound("skill_success")
             else:
                 # Default item use sound
@@ -305,50 +401,48 @@ class Character:
                 
         return True
     
+    def _new_effect_id(self):
+        """Return the next integer key for a status effect"""
+        effect_id = self._next_effect_id
+        self._next_effect_id += 1
+        return effect_id
+    
     def apply_status_effects(self):
         """Apply active status effects and remove expired ones"""
-        current_time = time.time()
+        current_turn = self.turn_counter
+        stats = self.stats
         stats_modified = {}
-        
-        # Track expired effects to remove
         expired_effects = []
         
-        # Process each effect
+        # Single pass: keep live effects in a fresh dict and apply them as we go
+        live_effects = {}
         for effect_id, effect in self.status_effects.items():
-            # Check if effect has expired
-            duration = effect.get('duration', 0)
-            applied_at = effect.get('applied_at', 0)
+            # Check if effect has expired (effects without expires_at are permanent)
+            expires_at = effect.get('expires_at')
             
-            if duration > 0 and current_time - applied_at > duration:
+            if expires_at is not None and expires_at <= current_turn:
                 expired_effects.append(effect_id)
                 continue
             
+            live_effects[effect_id] = effect
+            
             # Apply effect based on type
             effect_type = effect.get('type', '')
             
             if effect_type == 'stat_boost':
                 stat = effect.get('stat', '')
-                value = effect.get('value', 0)
-                
-                if stat in self.stats:
-                    if stat not in stats_modified:
-                        stats_modified[stat] = 0
-                    
-                    stats_modified[stat] += value
+                if stat in stats:
+                    stats_modified[stat] = stats_modified.get(stat, 0) + effect.get('value', 0)
             elif effect_type == 'damage_over_time':
-                damage = effect.get('damage', 0)
-                self.health = max(0, self.health - damage)
+                self.health = max(0, self.health - effect.get('damage', 0))
             elif effect_type == 'heal_over_time':
-                heal = effect.get('heal', 0)
-                self.health = min(self.max_health, self.health + heal)
+                self.health = min(self.max_health, self.health + effect.get('heal', 0))
+        
+        self.status_effects = live_effects
         
         # Apply stat modifications
         for stat, mod in stats_modified.items():
-            self.stats[stat] += mod
-        
-        # Remove expired effects
-        for effect_id in expired_effects:
-            del self.status_effects[effect_id]
+            stats[stat] += mod
         
         return {
             'modified_stats': stats_modified,
@@ -357,34 +451,21 @@ class Character:
         
     def _init_class_abilities(self):
         """Initialize class-specific abilities based on character class"""
-        # Import the abilities configuration
-        from combat import CLASS_ABILITIES
+        # Resolve this class's abilities once (empty if the class has none)
+        self._class_abilities = _get_class_abilities().get(self.char_class, {})
         
-        # Check if the character class has defined abilities
-        if self.char_class in CLASS_ABILITIES:
-            # Get abilities for this class
-            class_abilities = CLASS_ABILITIES[self.char_class]
-            
-            # Initialize cooldowns to 0 (ready to use)
-            for ability_id in class_abilities:
-                self.ability_cooldowns[ability_id] = 0
+        # Initialize cooldowns to 0 (ready to use)
+        for ability_id in self._class_abilities:
+            self.ability_cooldowns[ability_id] = 0
                 
     def get_available_abilities(self):
         """Get list of abilities available to the character that are not on cooldown"""
-        # Import the abilities configuration
-        from combat import CLASS_ABILITIES
-        
         available_abilities = {}
         
-        # Check if the character class has defined abilities
-        if self.char_class in CLASS_ABILITIES:
-            # Get abilities for this class
-            class_abilities = CLASS_ABILITIES[self.char_class]
-            
-            # Add abilities that are not on cooldown
-            for ability_id, ability_data in class_abilities.items():
-                if self.ability_cooldowns.get(ability_id, 0) <= 0:
-                    available_abilities[ability_id] = ability_data
+        # Add class abilities that are not on cooldown
+        for ability_id, ability_data in self._class_abilities.items():
+            if self.ability_cooldowns.get(ability_id, 0) <= 0:
+                available_abilities[ability_id] = ability_data
         
         # Check for abilities granted by skills and perks
         if hasattr(self, 'progression'):
@@ -399,17 +480,13 @@ class Character:
                         continue
                         
                     # Create an ability ID for this skill/perk ability
-                    ability_id = f"skill_{ability_name.lower().replace(' ', '_')}"
+                    lower_name = ability_name.lower()
+                    ability_id = f"skill_{lower_name.replace(' ', '_')}"
                     
                     # Try to find this ability in any class
-                    ability_data = None
-                    for class_name, abilities in CLASS_ABILITIES.items():
-                        for ab_id, data in abilities.items():
-                            if data.get('name') == ability_name:
-                                ability_data = data.copy()
-                                break
-                        if ability_data:
-                            break
+                    ability_data = _ABILITY_BY_NAME.get(ability_name)
+                    if ability_data:
+                        ability_data = ability_data.copy()
                     
                     # If not found in any class, create a basic entry
                     if not ability_data:
@@ -420,12 +497,10 @@ class Character:
                         }
                         
                         # Add some basic effects based on the name
-                        if "damage" in ability_name.lower() or "attack" in ability_name.lower():
-                            ability_data["damage_multiplier"] = 1.5
-                        elif "defense" in ability_name.lower() or "protect" in ability_name.lower():
-                            ability_data["defense_boost"] = 3
-                        elif "heal" in ability_name.lower():
-                            ability_data["self_heal"] = 10
+                        for keyword, effect, value in _FALLBACK_ABILITY_EFFECTS:
+                            if keyword in lower_name:
+                                ability_data[effect] = value
+                                break
                     
                     # Add to available abilities if not on cooldown
                     if self.ability_cooldowns.get(ability_id, 0) <= 0:
@@ -446,9 +521,6 @@ class Character:
         Returns:
             dict: Results of the ability use
         """
-        # Import the abilities configuration
-        from combat import CLASS_ABILITIES
-        
         # Get all available abilities including those from skills/perks
         available_abilities = self.get_available_abilities()
         
@@ -546,120 +618,126 @@ class Character:
                 if console:
                     console.print(f"[cyan]Attack affects entire area[/cyan]")
         
-        # Process ability effects
-        if "damage_multiplier" in ability:
-            # Calculate base damage from strength
-            base_damage = self.stats.get("strength", 3)
-            damage = int(base_damage * ability["damage_multiplier"])
-            result["effects"]["damage"] = damage
-            
-            if console:
-                console.print(f"[green]Used {ability['name']} for {damage} damage![/green]")
-        
-        if "attacks" in ability:
-            # Multiple attacks
-            attacks = ability["attacks"]
-            damage_mult = ability.get("damage_multiplier", 0.5)
-            base_damage = self.stats.get("strength", 3)
-            damage_per_hit = int(base_damage * damage_mult)
-            
-            result["effects"]["multi_attack"] = {
-                "hits": attacks,
-                "damage_per_hit": damage_per_hit
-            }
-            
-            if console:
-                console.print(f"[green]Used {ability['name']} for {attacks} attacks of {damage_per_hit} damage each![/green]")
+        # Process ability effects, running only the handlers for the effect
+        # keys this ability has, in their fixed order
+        present = ability.keys() & _ABILITY_HANDLERS.keys()
+        for effect_key in sorted(present, key=_ABILITY_HANDLER_ORDER.__getitem__):
+            _ABILITY_HANDLERS[effect_key](self, ability, target, result, console)
         
-        if "self_heal" in ability:
-            # Heal the player
-            heal_amount = ability["self_heal"]
-            old_health = self.health
-            self.health = min(self.max_health, self.health + heal_amount)
-            actual_heal = self.health - old_health
-            
-            result["effects"]["heal"] = actual_heal
-            
-            if console:
-                console.print(f"[green]Used {ability['name']} to heal for {actual_heal} health![/green]")
+        # Set cooldown
+        cooldown = ability.get("cooldown", 3)
+        self.ability_cooldowns[ability_id] = cooldown
         
-        if "status_effect" in ability:
-            # Apply status effect to enemy
-            status = ability["status_effect"]
-            result["effects"]["status"] = status
-            
-            if console:
-                console.print(f"[green]Used {ability['name']} to apply {status} status![/green]")
+        # Return the results
+        return result
+    
+    def _ability_damage(self, ability, target, result, console):
+        """Deal damage scaled from strength"""
+        base_damage = self.stats.get("strength", 3)
+        damage = int(base_damage * ability["damage_multiplier"])
+        result["effects"]["damage"] = damage
+        
+        if console:
+            console.print(f"[green]Used {ability['name']} for {damage} damage![/green]")
+    
+    def _ability_multi_attack(self, ability, target, result, console):
+        """Make several weaker attacks"""
+        attacks = ability["attacks"]
+        damage_mult = ability.get("damage_multiplier", 0.5)
+        base_damage = self.stats.get("strength", 3)
+        damage_per_hit = int(base_damage * damage_mult)
+        
+        result["effects"]["multi_attack"] = {
+            "hits": attacks,
+            "damage_per_hit": damage_per_hit
+        }
         
-        if "defense_boost" in ability:
-            # Apply defense boost as a status effect
-            boost = ability["defense_boost"]
-            duration = ability.get("duration", 3)
-            
-            # Add status effect
-            effect_id = f"defense_boost_{time.time()}"
-            self.status_effects[effect_id] = {
-                'type': 'defense_boost',
-                'value': boost,
-                'duration': duration,
-                'applied_at': time.time()
-            }
-            
-            result["effects"]["defense_boost"] = boost
-            
-            if console:
-                console.print(f"[green]Used {ability['name']} to boost defense by {boost} for {duration} turns![/green]")
+        if console:
+            console.print(f"[green]Used {ability['name']} for {attacks} attacks of {damage_per_hit} damage each![/green]")
+    
+    def _ability_self_heal(self, ability, target, result, console):
+        """Heal the player"""
+        heal_amount = ability["self_heal"]
+        old_health = self.health
+        self.health = min(self.max_health, self.health + heal_amount)
+        actual_heal = self.health - old_health
         
-        if "reveal_weakness" in ability:
-            # Mark enemy as analyzed
-            if target:
-                self.active_effects["analyzed_enemy"] = target.name
-                target.analyzed = True
-                
-                if console:
-                    console.print(f"[green]Used {ability['name']} to reveal {target.name}'s weaknesses![/green]")
-                
-                result["effects"]["analyzed"] = True
+        result["effects"]["heal"] = actual_heal
         
-        if "bonus_damage" in ability and "duration" in ability:
-            # Deploy a drone or similar effect that deals damage each turn
-            damage = ability["bonus_damage"]
-            duration = ability["duration"]
-            
-            self.active_effects["drone_damage"] = damage
-            self.active_effects["drone_turns"] = duration
-            
-            result["effects"]["drone"] = {
-                "damage": damage,
-                "duration": duration
-            }
-            
-            if console:
-                console.print(f"[green]Used {ability['name']} to deploy a drone that will deal {damage} damage for {duration} turns![/green]")
+        if console:
+            console.print(f"[green]Used {ability['name']} to heal for {actual_heal} health![/green]")
+    
+    def _ability_status(self, ability, target, result, console):
+        """Apply a status effect to the enemy"""
+        status = ability["status_effect"]
+        result["effects"]["status"] = status
         
-        if "self_damage" in ability:
-            # Ability that hurts the player
-            damage = ability["self_damage"]
-            self.health = max(0, self.health - damage)
-            
-            result["effects"]["self_damage"] = damage
-            
-            if console:
-                console.print(f"[red]{ability['name']} caused you to take {damage} damage![/red]")
+        if console:
+            console.print(f"[green]Used {ability['name']} to apply {status} status![/green]")
+    
+    def _ability_defense_boost(self, ability, target, result, console):
+        """Apply a defense boost as a status effect"""
+        boost = ability["defense_boost"]
+        duration = ability.get("duration", 3)
+        
+        self.status_effects[self._new_effect_id()] = {
+            'type': 'defense_boost',
+            'value': boost,
+            'duration': duration,
+            'expires_at': self.turn_counter + duration
+        }
+        
+        result["effects"]["defense_boost"] = boost
         
-        if "escape_boost" in ability:
-            # Boost escape chance
-            result["effects"]["escape_boost"] = ability["escape_boost"]
+        if console:
+            console.print(f"[green]Used {ability['name']} to boost defense by {boost} for {duration} turns![/green]")
+    
+    def _ability_reveal_weakness(self, ability, target, result, console):
+        """Mark the enemy as analyzed"""
+        if target:
+            self.analyzed_enemy = target.name
+            target.analyzed = True
             
             if console:
-                console.print(f"[green]Used {ability['name']} to increase escape chance![/green]")
+                console.print(f"[green]Used {ability['name']} to reveal {target.name}'s weaknesses![/green]")
+            
+            result["effects"]["analyzed"] = True
+    
+    def _ability_drone(self, ability, target, result, console):
+        """Deploy a drone or similar effect that deals damage each turn"""
+        if "duration" not in ability:
+            return
         
-        # Set cooldown
-        cooldown = ability.get("cooldown", 3)
-        self.ability_cooldowns[ability_id] = cooldown
+        damage = ability["bonus_damage"]
+        duration = ability["duration"]
         
-        # Return the results
-        return result
+        self.drone_damage = damage
+        self.drone_turns = duration
+        
+        result["effects"]["drone"] = {
+            "damage": damage,
+            "duration": duration
+        }
+        
+        if console:
+            console.print(f"[green]Used {ability['name']} to deploy a drone that will deal {damage} damage for {duration} turns![/green]")
+    
+    def _ability_self_damage(self, ability, target, result, console):
+        """Hurt the player as the ability's cost"""
+        damage = ability["self_damage"]
+        self.health = max(0, self.health - damage)
+        
+        result["effects"]["self_damage"] = damage
+        
+        if console:
+            console.print(f"[red]{ability['name']} caused you to take {damage} damage![/red]")
+    
+    def _ability_escape_boost(self, ability, target, result, console):
+        """Boost the chance to escape"""
+        result["effects"]["escape_boost"] = ability["escape_boost"]
+        
+        if console:
+            console.print(f"[green]Used {ability['name']} to increase escape chance![/green]")
     
     def process_combat_effects(self):
         """Process combat-specific effects at the start of the player's turn"""
@@ -668,16 +746,19 @@ class Character:
             "drone_damage": 0
         }
         
+        # Advance the turn clock that status effects expire against
+        self.turn_counter += 1
+        
         # Check for drone damage
-        if self.active_effects["drone_turns"] > 0:
-            drone_damage = self.active_effects["drone_damage"]
-            self.active_effects["drone_turns"] -= 1
+        if self.drone_turns > 0:
+            drone_damage = self.drone_damage
+            self.drone_turns -= 1
             
-            if self.active_effects["drone_turns"] <= 0:
-                self.active_effects["drone_damage"] = 0
+            if self.drone_turns <= 0:
+                self.drone_damage = 0
                 results["messages"].append("Your combat drone has deactivated")
             else:
-                results["messages"].append(f"Your combat drone is active for {self.active_effects['drone_turns']} more turns")
+                results["messages"].append(f"Your combat drone is active for {self.drone_turns} more turns")
                 results["drone_damage"] = drone_damage
         
         # Reduce ability cooldowns
@@ -688,3 +769,17 @@ class Character:
                     results["messages"].append(f"Ability {ability_id} is ready to use again")
         
         return results
+
+# use_ability's handler for each ability effect key, in the order they apply
+_ABILITY_HANDLERS = {
+    "damage_multiplier": Character._ability_damage,
+    "attacks": Character._ability_multi_attack,
+    "self_heal": Character._ability_self_heal,
+    "status_effect": Character._ability_status,
+    "defense_boost": Character._ability_defense_boost,
+    "reveal_weakness": Character._ability_reveal_weakness,
+    "bonus_damage": Character._ability_drone,
+    "self_damage": Character._ability_self_damage,
+    "escape_boost": Character._ability_escape_boost
+}
+_ABILITY_HANDLER_ORDER = {key: index for index, key in enumerate(_ABILITY_HANDLERS)}
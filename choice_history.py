@@ -3,14 +3,82 @@ Choice History Module - Tracks and manages player choices for story generation
 """
 import time
 import json
+from collections import deque
+from itertools import islice
+
+def _items_gained(value):
+    """Phrase items gained from a choice"""
+    return [f"gained {count} {item}" for item, count in value.items()] if value else []
+
+def _items_lost(value):
+    """Phrase items lost to a choice"""
+    return [f"lost {count} {item}" for item, count in value.items()] if value else []
+
+def _health_change(value):
+    """Phrase a change in health"""
+    if value > 0:
+        return [f"healed {value} health"]
+    if value < 0:
+        return [f"took {abs(value)} damage"]
+    return []
+
+def _credits_change(value):
+    """Phrase a change in credits"""
+    if value > 0:
+        return [f"gained {value} credits"]
+    if value < 0:
+        return [f"lost {abs(value)} credits"]
+    return []
+
+# Narrative phrasing for each consequence key; other keys aren't described
+_CONSEQUENCE_FORMATTERS = {
+    'items_gained': _items_gained,
+    'items_lost': _items_lost,
+    'health_change': _health_change,
+    'credits_change': _credits_change
+}
+
+def _format_consequences(consequences):
+    """Describe a choice's consequences as a list of short phrases"""
+    phrases = []
+    for key, value in consequences.items():
+        formatter = _CONSEQUENCE_FORMATTERS.get(key)
+        if formatter:
+            phrases.extend(formatter(value))
+    return phrases
 
 class ChoiceHistory:
     """Manages a history of player choices for enhanced story generation"""
     
     def __init__(self):
         """Initialize the choice history tracker"""
-        self.choices = []
         self.max_choices = 20  # Maximum number of choices to remember
+        # The deque drops the oldest choice itself once max_choices is reached
+        self.choices = deque(maxlen=self.max_choices)
+        
+        # Indexes of the remembered choices by node and by consequence key,
+        # each list oldest first like self.choices
+        self._by_node = {}
+        self._by_consequence = {}
+    
+    def _index_choice(self, choice):
+        """Add a choice to the node and consequence indexes"""
+        self._by_node.setdefault(choice['node_id'], deque()).append(choice)
+        for key in choice.get('consequences', {}):
+            self._by_consequence.setdefault(key, deque()).append(choice)
+    
+    def _unindex_oldest(self, choice):
+        """Remove the oldest remembered choice from the indexes"""
+        # Being the oldest overall, it is also at the front of every index it's in
+        node_choices = self._by_node[choice['node_id']]
+        node_choices.popleft()
+        if not node_choices:
+            del self._by_node[choice['node_id']]
+        for key in choice.get('consequences', {}):
+            key_choices = self._by_consequence[key]
+            key_choices.popleft()
+            if not key_choices:
+                del self._by_consequence[key]
     
     def add_choice(self, node_id, choice_text, next_node, consequences=None):
         """Add a choice to the history
@@ -21,21 +89,29 @@ class ChoiceHistory:
             next_node (str): The ID of the next node after the choice
             consequences (dict, optional): Any consequences of the choice
         """
-        # Create a record of the choice
+        # Create a record of the choice; consequences are copied because the
+        # caller's dict (often a story node's) may change after this, and the
+        # consequence index must match what was recorded
         choice_record = {
             'timestamp': time.time(),
             'node_id': node_id,
             'choice_text': choice_text,
             'next_node': next_node,
-            'consequences': consequences or {}
+            'consequences': dict(consequences) if consequences else {}
         }
         
-        # Add to the history
+        # Add to the history, letting the oldest choice go when full
+        if len(self.choices) == self.max_choices:
+            self._unindex_oldest(self.choices[0])
         self.choices.append(choice_record)
-        
-        # Trim if we have too many choices
-        if len(self.choices) > self.max_choices:
-            self.choices = self.choices[-self.max_choices:]
+        self._index_choice(choice_record)
+    
+    def _last_choices(self, count):
+        """Get up to count of the newest choices as a list, oldest first"""
+        # A count of zero or less means the whole history, as [-count:] gave
+        if count <= 0:
+            return list(self.choices)
+        return list(islice(self.choices, max(0, len(self.choices) - count), None))
     
     def get_recent_choices(self, count=5):
         """Get the most recent choices
@@ -46,7 +122,7 @@ class ChoiceHistory:
         Returns:
             list: The most recent choices, newest first
         """
-        return self.choices[-count:]
+        return self._last_choices(count)
     
     def get_choices_for_node(self, node_id):
         """Get all choices made at a specific node
@@ -57,7 +133,7 @@ class ChoiceHistory:
         Returns:
             list: All choices made at the specified node
         """
-        return [choice for choice in self.choices if choice['node_id'] == node_id]
+        return list(self._by_node.get(node_id, ()))
     
     def get_choices_with_consequence(self, consequence_key):
         """Get all choices that had a specific consequence
@@ -68,10 +144,7 @@ class ChoiceHistory:
         Returns:
             list: All choices with the specified consequence
         """
-        return [
-            choice for choice in self.choices 
-            if consequence_key in choice.get('consequences', {})
-        ]
+        return list(self._by_consequence.get(consequence_key, ()))
     
     def get_narrative_summary(self, limit=10):
         """Get a narrative summary of recent choices for prompts
@@ -85,7 +158,7 @@ class ChoiceHistory:
         if not self.choices:
             return "No previous choices have been made."
         
-        recent_choices = self.choices[-limit:]
+        recent_choices = self._last_choices(limit)
         narrative = []
         
         for choice in recent_choices:
@@ -93,24 +166,7 @@ class ChoiceHistory:
             choice_text = choice['choice_text']
             
             # Format consequences if any
-            consequences = []
-            for key, value in choice.get('consequences', {}).items():
-                if key == 'items_gained' and value:
-                    for item, count in value.items():
-                        consequences.append(f"gained {count} {item}")
-                elif key == 'items_lost' and value:
-                    for item, count in value.items():
-                        consequences.append(f"lost {count} {item}")
-                elif key == 'health_change':
-                    if value > 0:
-                        consequences.append(f"healed {value} health")
-                    elif value < 0:
-                        consequences.append(f"took {abs(value)} damage")
-                elif key == 'credits_change':
-                    if value > 0:
-                        consequences.append(f"gained {value} credits")
-                    elif value < 0:
-                        consequences.append(f"lost {abs(value)} credits")
+            consequences = _format_consequences(choice.get('consequences', {}))
             
             # Create narrative line
             line = f"At location '{node_id}', the player chose to '{choice_text}'"
@@ -127,7 +183,7 @@ class ChoiceHistory:
             dict: The choice history as a dictionary
         """
         return {
-            'choices': self.choices,
+            'choices': list(self.choices),
             'max_choices': self.max_choices
         }
     
@@ -142,6 +198,8 @@ class ChoiceHistory:
             ChoiceHistory: A new choice history object
         """
         history = cls()
-        history.choices = data.get('choices', [])
         history.max_choices = data.get('max_choices', 20)
+        history.choices = deque(data.get('choices', []), maxlen=history.max_choices)
+        for choice in history.choices:
+            history._index_choice(choice)
         return history
\ No newline at end of file
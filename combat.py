@@ -1142,7 +1142,7 @@ def run_combat(console, player, enemy, player_damage_multiplier=1.0, use_animati
         display_cover_info(console, player.current_cover)
         
         # If enemy is analyzed, show more information
-        if enemy.analyzed or (player.active_effects.get("analyzed_enemy") == enemy.name):
+        if enemy.analyzed or (player.analyzed_enemy == enemy.name):
             console.print(f"[{COLORS['primary']}]ANALYZED: {enemy.name}[/{COLORS['primary']}]")
             if enemy.weaknesses:
                 console.print(f"[{COLORS['text']}]Weaknesses: {', '.join(enemy.weaknesses)}[/{COLORS['text']}]")
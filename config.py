@@ -45,6 +45,7 @@ GAME_SETTINGS = {
     "effects_enabled": True,
     "music_volume": 0.5,    # 0.0 to 1.0
     "effects_volume": 0.7,  # 0.0 to 1.0
+    "audio_buffer": 1024,   # Mixer buffer in samples; latency is buffer / 44100 s (~23 ms)
     
     # UI Animation settings
     "ui_animations_enabled": True,
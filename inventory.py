@@ -3,12 +3,16 @@ Inventory Module - Handles player inventory and items
 """
 import os
 import json
+import copy
 
 from config import DATA_DIR
 
 class Inventory:
     """Inventory management for the player"""
     
+    # Item definitions are static, so they are read once and shared
+    _items_data_cache = None
+    
     def __init__(self):
         """Initialize a new inventory"""
         self.items = {}  # Format: {item_name: quantity}
@@ -29,6 +33,10 @@ class Inventory:
     
     def _load_items_data(self):
         """Load item data from JSON file"""
+        if Inventory._items_data_cache is not None:
+            self.items_data = Inventory._items_data_cache
+            return
+        
         self.items_data = {}
         items_file = os.path.join(DATA_DIR, 'items.json')
         
@@ -47,6 +55,8 @@ class Inventory:
             print(f"Error loading items data: {str(e)}")
             # Create default items on error
             self._create_default_items()
+        
+        Inventory._items_data_cache = self.items_data
     
     def _create_default_items(self):
         """Create default items data"""
@@ -229,8 +239,12 @@ class Inventory:
 
 def get_item_info(item_name):
     """Get information about an item"""
-    # Create a simple inventory to access items data
-    temp_inventory = Inventory()
+    items_data = Inventory._items_data_cache
+    if items_data is None:
+        # First lookup loads the shared item definitions
+        items_data = Inventory().items_data
     
-    # Return the item data if found
-    return temp_inventory.items_data.get(item_name, None)
+    # Return a copy of the item data if found, so callers can't change the
+    # definitions every inventory shares
+    item_info = items_data.get(item_name, None)
+    return copy.deepcopy(item_info) if item_info is not None else None
@@ -39,8 +39,11 @@ def save_game(save_name, save_data):
     save_path = os.path.join(SAVE_DIR, f"{save_name}.json")
     
     try:
+        # Compact separators keep json on its C encoder (indent forces the
+        # pure-Python one), and encoding up front makes the file one write
+        save_json = json.dumps(save_data, separators=(',', ':'))
         with open(save_path, 'w') as f:
-            json.dump(save_data, f, indent=2)
+            f.write(save_json)
         return True
     except Exception as e:
         print(f"Error saving game: {str(e)}")
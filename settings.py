@@ -97,6 +97,7 @@ def reset_to_defaults():
     GAME_SETTINGS["effects_enabled"] = True
     GAME_SETTINGS["music_volume"] = 0.5
     GAME_SETTINGS["effects_volume"] = 0.7
+    GAME_SETTINGS["audio_buffer"] = 1024
     
     # UI Animation settings
     GAME_SETTINGS["ui_animations_enabled"] = True
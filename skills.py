@@ -546,6 +546,16 @@ class CharacterProgression:
         
         # Track skill experience separately from level
         self.skill_experience = {}  # Dictionary of skill_id -> current_xp
+        
+        # calculate_all_effects() result, reused until the skills, perks,
+        # specialization or synergies change (see _effects_changed)
+        self._effects_version = 0
+        self._cached_effects = None
+        self._cached_effects_version = -1
+    
+    def _effects_changed(self):
+        """Invalidate the cached calculate_all_effects() result"""
+        self._effects_version += 1
     
     def to_dict(self) -> Dict:
         """Convert progression data to dictionary for saving"""
@@ -630,6 +640,7 @@ class CharacterProgression:
         
         # Increment skill level
         self.skills[skill_id]["level"] += 1
+        self._effects_changed()
         
         # Deduct skill point
         self.skill_points -= 1
@@ -687,6 +698,7 @@ class CharacterProgression:
         
         # Add perk to character
         self.perks.append(perk_id)
+        self._effects_changed()
         
         # Deduct perk point
         self.perk_points -= 1
@@ -827,6 +839,7 @@ class CharacterProgression:
         
         # Set the specialization
         self.specialization = specialization
+        self._effects_changed()
         
         return True, f"Successfully specialized as {specialization}"
     
@@ -870,6 +883,7 @@ class CharacterProgression:
         if current_level < skill.max_level and self.skill_experience[skill_id] >= xp_for_next_level:
             # Level up the skill
             self.skills[skill_id]["level"] += 1
+            self._effects_changed()
             level_up = True
             
             # Reset XP for next level
@@ -969,6 +983,7 @@ class CharacterProgression:
             # Apply synergy if meets requirements and not already active
             if has_all_required and synergy_id not in self.active_synergies:
                 self.active_synergies[synergy_id] = 1
+                self._effects_changed()
     
     def get_specialization_bonuses(self) -> Dict:
         """
@@ -1065,9 +1080,22 @@ class CharacterProgression:
         """
         Calculate all effects from skills, perks, specializations and synergies
         
+        The totals are cached until progression changes; each call gets its
+        own copy, so callers are free to modify the result
+        
         Returns:
             Dictionary of effects
         """
+        if self._cached_effects_version != self._effects_version:
+            self._cached_effects = self._compute_all_effects()
+            self._cached_effects_version = self._effects_version
+        
+        effects = self._cached_effects
+        return dict(effects, stat_bonuses=dict(effects["stat_bonuses"]),
+                    abilities=list(effects["abilities"]))
+    
+    def _compute_all_effects(self) -> Dict:
+        """Total the effects of skills, perks, specialization and synergies"""
         effects = {
             "damage_bonus": 0,
             "defense_bonus": 0,
@@ -1178,5 +1206,5 @@ class CharacterProgression:
             elif category == "tech":
                 effects["healing_bonus"] += mastery_level * 3
                 effects["electronics_bonus"] += mastery_level * 5
-                
+        
         return effects
\ No newline at end of file
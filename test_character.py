@@ -0,0 +1,143 @@
+"""
+Test script for the character module
+"""
+import json
+from rich.console import Console
+from character import Character
+from config import LEVEL_UP_BASE_XP
+
+console = Console()
+
+class StubProgression:
+    """Stands in for CharacterProgression, whose award_experience calls back
+    into Character.add_experience; it awards points by the same rules:
+    2 skill points per level-up and a perk point every third level"""
+    
+    def __init__(self, character):
+        self.character = character
+    
+    def award_experience(self, xp_amount):
+        if xp_amount:
+            return {"skill_points_gained": 0, "perk_points_gained": 0}
+        return {
+            "skill_points_gained": 2,
+            "perk_points_gained": 1 if self.character.level % 3 == 0 else 0
+        }
+
+def test_multi_level_experience():
+    """Test that one large XP grant levels up once per threshold crossed"""
+    console.print("[bold cyan]Testing Multi-Level Experience...[/bold cyan]")
+    
+    character = Character("Test Runner", "NetRunner")
+    character.progression = StubProgression(character)
+    start_health = character.max_health
+    
+    result = character.add_experience(1000)
+    
+    # Baseline rule: leave level L once total XP reaches LEVEL_UP_BASE_XP * L * 1.5
+    level = 1
+    while 1000 >= LEVEL_UP_BASE_XP * level * 1.5:
+        level += 1
+    expected_health = 10 + character.stats["strength"] * 2 + level * 2
+    
+    assert character.level == level == 7
+    assert character.experience == 1000  # XP is cumulative, nothing is spent
+    assert character.max_health == character.health == expected_health
+    assert result["new_level"] == level
+    assert result["health_increase"] == expected_health - start_health
+    assert result["skill_points_gained"] == 2 * (level - 1)
+    assert result["perk_points_gained"] == 2  # Levels 3 and 6
+    console.print(f"Reached level {character.level}: {result}")
+    
+    # The next grant that doesn't reach the following threshold levels nothing
+    assert character.add_experience(10) is None
+    assert character.level == level
+
+def test_baseline_save_status_effects():
+    """Test that status effects from a baseline-format save expire on the turn clock"""
+    console.print("\n[bold cyan]Testing Baseline Save Status Effects...[/bold cyan]")
+    
+    # Saves from before the turn counter: timestamp keys and applied_at, no counters
+    save = Character("Test Runner", "NetRunner").to_dict()
+    del save['turn_counter']
+    del save['next_effect_id']
+    save['status_effects'] = {
+        "intelligence_boost_1712345678.25": {
+            'type': 'stat_boost', 'stat': 'intelligence', 'value': 2,
+            'duration': 3, 'applied_at': 1712345678.25
+        },
+        "defense_boost_1712345679.5": {
+            'type': 'defense_boost', 'value': 4,
+            'duration': 1, 'applied_at': 1712345679.5
+        }
+    }
+    
+    character = Character.from_dict(save)
+    assert character.turn_counter == 0
+    
+    # Restored effects get the turn they expire on, counted from the load
+    expired_on = {}
+    for turn in range(1, 5):
+        character.process_combat_effects()  # Advances the turn counter
+        for effect_id in character.apply_status_effects()['expired_effects']:
+            expired_on[effect_id] = turn
+    assert expired_on == {
+        "defense_boost_1712345679.5": 1,
+        "intelligence_boost_1712345678.25": 3
+    }
+    assert character.status_effects == {}
+    console.print(f"Restored effects expired on turns {expired_on}")
+
+def test_restored_effect_ids_dont_collide():
+    """Test that new effect ids never reuse an id restored from a save"""
+    console.print("\n[bold cyan]Testing Restored Effect Ids...[/bold cyan]")
+    
+    # JSON writes the integer ids as strings; this save has no stored counter
+    save = Character("Test Runner", "NetRunner").to_dict()
+    del save['next_effect_id']
+    save['status_effects'] = {
+        "0": {'type': 'stat_boost', 'stat': 'reflex', 'value': 1, 'duration': 5, 'expires_at': 5},
+        "4": {'type': 'stat_boost', 'stat': 'reflex', 'value': 1, 'duration': 5, 'expires_at': 5},
+        "reflex_boost_1712345678.25": {'type': 'stat_boost', 'stat': 'reflex', 'value': 1,
+                                       'duration': 5, 'applied_at': 1712345678.25}
+    }
+    
+    character = Character.from_dict(save)
+    assert {0, 4} <= set(character.status_effects)
+    
+    restored = set(character.status_effects)
+    new_ids = {character._new_effect_id() for _ in range(3)}
+    assert not new_ids & restored
+    assert min(new_ids) == 5
+    console.print(f"Restored ids {restored}, new ids {new_ids}")
+
+def test_active_effects_view():
+    """Test that active_effects can't be written through and saves as a plain dict"""
+    console.print("\n[bold cyan]Testing Active Effects View...[/bold cyan]")
+    
+    character = Character("Test Runner", "NetRunner")
+    
+    # Item writes raise instead of landing on a throwaway copy
+    try:
+        character.active_effects['focus_bonus'] = 5
+        assert False, "active_effects accepted an item write"
+    except TypeError:
+        pass
+    assert character.focus_bonus == 0
+    
+    character.focus_bonus = 5
+    character.active_effects = dict(character.active_effects, drone_turns=2)
+    assert character.active_effects['focus_bonus'] == 5
+    assert character.drone_turns == 2
+    
+    saved = json.loads(json.dumps(character.to_dict()))
+    assert saved['active_effects'] == dict(character.active_effects)
+    console.print(f"Active effects: {dict(character.active_effects)}")
+
+if __name__ == "__main__":
+    console.print("[bold magenta]===== CHARACTER MODULE TESTS =====[/bold magenta]")
+    test_multi_level_experience()
+    test_baseline_save_status_effects()
+    test_restored_effect_ids_dont_collide()
+    test_active_effects_view()
+    console.print("\n[bold green]All tests completed![/bold green]")
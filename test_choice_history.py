@@ -0,0 +1,74 @@
+"""
+Test script for the choice history module
+"""
+from rich.console import Console
+from choice_history import ChoiceHistory
+
+console = Console()
+
+def test_eviction_updates_indexes():
+    """Test that choices dropped past max_choices leave the lookups too"""
+    console.print("[bold cyan]Testing Choice History Eviction...[/bold cyan]")
+    
+    history = ChoiceHistory()
+    
+    # The first choice is the only one at 'start' and the only one with loot
+    history.add_choice("start", "Take the job", "alley", {"items_gained": {"Stimpack": 1}})
+    for i in range(history.max_choices):
+        history.add_choice(f"node_{i % 3}", "Keep moving", "street", {"health_change": -1})
+    
+    assert len(history.choices) == history.max_choices
+    assert history.get_choices_for_node("start") == []
+    assert history.get_choices_with_consequence("items_gained") == []
+    
+    # Every remembered choice is still reachable through the lookups
+    assert len(history.get_choices_with_consequence("health_change")) == history.max_choices
+    by_node = sum(len(history.get_choices_for_node(f"node_{i}")) for i in range(3))
+    assert by_node == history.max_choices
+    console.print("Evicted choice removed from node and consequence lookups")
+
+def test_caller_consequences_are_copied():
+    """Test that changing the caller's consequences dict later can't desync the indexes"""
+    console.print("\n[bold cyan]Testing Consequence Copying...[/bold cyan]")
+    
+    history = ChoiceHistory()
+    consequences = {"credits_change": 50}
+    history.add_choice("market", "Sell the chip", "street", consequences)
+    
+    # The story node's dict changes after the choice was recorded
+    consequences["health_change"] = -5
+    del consequences["credits_change"]
+    
+    assert history.get_choices_with_consequence("health_change") == []
+    assert len(history.get_choices_with_consequence("credits_change")) == 1
+    
+    # Evicting it must not trip over the changed keys
+    for i in range(history.max_choices):
+        history.add_choice("street", "Walk on", "street")
+    assert history.get_choices_with_consequence("credits_change") == []
+    assert history.get_choices_for_node("market") == []
+    console.print("Recorded consequences are independent of the caller's dict")
+
+def test_recent_choices():
+    """Test that get_recent_choices slices the newest choices like the old list did"""
+    console.print("\n[bold cyan]Testing Recent Choices...[/bold cyan]")
+    
+    history = ChoiceHistory()
+    for i in range(4):
+        history.add_choice(f"node_{i}", "Keep moving", "street")
+    
+    recent = [choice['node_id'] for choice in history.get_recent_choices(2)]
+    assert recent == ["node_2", "node_3"]
+    assert len(history.get_recent_choices(10)) == 4
+    
+    # A count of zero (or less) gives the whole history
+    assert history.get_recent_choices(0) == list(history.choices)
+    assert history.get_recent_choices(-1) == list(history.choices)
+    console.print("Recent choices match the list slice")
+
+if __name__ == "__main__":
+    console.print("[bold magenta]===== CHOICE HISTORY TESTS =====[/bold magenta]")
+    test_eviction_updates_indexes()
+    test_caller_consequences_are_copied()
+    test_recent_choices()
+    console.print("\n[bold green]All tests completed![/bold green]")
@@ -0,0 +1,27 @@
+"""
+Test script for the inventory module
+"""
+from rich.console import Console
+from inventory import Inventory, get_item_info
+
+console = Console()
+
+def test_item_info_is_a_copy():
+    """Test that changing looked-up item info leaves the shared definitions alone"""
+    console.print("[bold cyan]Testing Item Info Copies...[/bold cyan]")
+    
+    item_info = get_item_info("Stimpack")
+    original = dict(item_info, effects=dict(item_info["effects"]))
+    
+    item_info["usable"] = False
+    item_info["effects"]["health"] = 999
+    
+    assert get_item_info("Stimpack") == original
+    assert Inventory().items_data["Stimpack"] == original
+    assert get_item_info("No Such Item") is None
+    console.print("Item definitions unchanged after editing a lookup")
+
+if __name__ == "__main__":
+    console.print("[bold magenta]===== INVENTORY MODULE TESTS =====[/bold magenta]")
+    test_item_info_is_a_copy()
+    console.print("\n[bold green]All tests completed![/bold green]")
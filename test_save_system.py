@@ -0,0 +1,68 @@
+"""
+Test script for the save system module
+"""
+import os
+import tempfile
+from rich.console import Console
+import save_system
+from character import Character
+from choice_history import ChoiceHistory
+
+console = Console()
+
+def test_save_load_round_trip():
+    """Test that a saved game loads back with the same state"""
+    console.print("[bold cyan]Testing Save/Load Round Trip...[/bold cyan]")
+    
+    player = Character("Test Runner", "NetRunner")
+    player.credits = 1234
+    player.inventory.add_item("Stim Pack", 2)
+    player.status_effects[player._new_effect_id()] = {
+        'type': 'stat_boost', 'stat': 'reflex', 'value': 2, 'duration': 3, 'expires_at': 3
+    }
+    
+    history = ChoiceHistory()
+    history.add_choice("start", "Jack in", "network", {"reputation": 5})
+    history.add_choice("network", "Trace the signal", "server_room")
+    
+    save_data = {
+        'player': player.to_dict(),
+        'current_node': "server_room",
+        'choice_history': history.to_dict(),
+        'metadata': {
+            'character_name': player.name,
+            'character_class': player.char_class,
+            'level': player.level,
+            'save_date': "2024-04-05 12:00:00"
+        }
+    }
+    
+    original_save_dir = save_system.SAVE_DIR
+    with tempfile.TemporaryDirectory() as save_dir:
+        save_system.SAVE_DIR = save_dir
+        try:
+            assert save_system.save_game("round trip", save_data)
+    
+            save_file = os.path.join(save_dir, "round_trip.json")
+            assert save_system.get_save_files() == [save_file]
+            assert save_system.get_save_metadata(save_file) == save_data['metadata']
+    
+            loaded = save_system.load_game(save_file)
+        finally:
+            save_system.SAVE_DIR = original_save_dir
+    
+    assert loaded['current_node'] == "server_room"
+    assert loaded['metadata'] == save_data['metadata']
+    
+    # JSON writes the integer effect ids as strings; from_dict turns them back
+    restored_player = Character.from_dict(loaded['player'])
+    assert restored_player.to_dict() == player.to_dict()
+    
+    restored_history = ChoiceHistory.from_dict(loaded['choice_history'])
+    assert restored_history.to_dict() == history.to_dict()
+    console.print(f"Restored {restored_player.name} with {len(restored_history.choices)} choices")
+
+if __name__ == "__main__":
+    console.print("[bold magenta]===== SAVE SYSTEM MODULE TESTS =====[/bold magenta]")
+    test_save_load_round_trip()
+    console.print("\n[bold green]All tests completed![/bold green]")
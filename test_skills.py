@@ -93,8 +93,63 @@ def test_character_progression():
     progression._check_skill_synergies()
     console.print(f"Active synergies: {progression.active_synergies}")
 
+def test_effects_cache_invalidation():
+    """Test that every progression change refreshes calculate_all_effects"""
+    console.print("\n[bold cyan]Testing Effects Cache...[/bold cyan]")
+    
+    class MockCharacter:
+        def __init__(self):
+            self.level = 6
+            self.stats = {"strength": 5, "intelligence": 8, "reflex": 6, "charisma": 4}
+    
+    character = MockCharacter()
+    progression = CharacterProgression(character, SkillTree())
+    character.progression = progression
+    progression.add_skill_points(20)
+    progression.add_perk_points(2)
+    
+    def check_refreshed(before, action):
+        effects = progression.calculate_all_effects()
+        assert effects != before, f"{action} didn't change the effects"
+        assert effects == progression._compute_all_effects(), f"{action} left stale effects"
+        console.print(f"{action}: refreshed")
+        return effects
+    
+    effects = progression.calculate_all_effects()
+    
+    # Each caller gets its own copy, nested containers included
+    effects["damage_bonus"] += 100
+    effects["stat_bonuses"]["strength"] += 100
+    effects["abilities"].append("Tampered")
+    effects = progression.calculate_all_effects()
+    assert effects == progression._compute_all_effects()
+    assert "Tampered" not in effects["abilities"]
+    
+    for _ in range(3):
+        assert progression.learn_skill("melee_master")[0]
+        effects = check_refreshed(effects, "Learning a skill level")
+    
+    assert progression.learn_perk("cyber_berserk")[0]
+    effects = check_refreshed(effects, "Learning a perk")
+    
+    assert progression.set_specialization("NetRunner")[0]
+    effects = check_refreshed(effects, "Choosing a specialization")
+    
+    assert progression.gain_skill_experience("network_infiltrator", 100)["level_up"]
+    effects = check_refreshed(effects, "A skill level-up from experience")
+    
+    # Raise both hacker_ghost skills to 3 without checking synergies, then activate it
+    for skill_id in ("network_infiltrator", "network_infiltrator", "shadow_walker",
+                     "shadow_walker", "shadow_walker"):
+        assert progression.learn_skill(skill_id)[0]
+    effects = progression.calculate_all_effects()
+    progression._check_skill_synergies()
+    assert "hacker_ghost" in progression.active_synergies
+    check_refreshed(effects, "Activating a synergy")
+
 if __name__ == "__main__":
     console.print("[bold magenta]===== SKILLS MODULE TESTS =====[/bold magenta]")
     test_skill_tree()
     test_character_progression()
+    test_effects_cache_invalidation()
     console.print("\n[bold green]All tests completed![/bold green]")
\ No newline at end of file